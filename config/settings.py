@@ -1,15 +1,25 @@
 """Application settings — all configuration loaded from environment variables.
 
 Usage:
-    from config.settings import Settings
-    settings = Settings()
-    settings.validate()   # raises ValueError if ANTHROPIC_API_KEY is missing
+    from config.settings import get_settings
+    settings = get_settings()   # cached process-wide instance
+    settings.validate()         # raises ValueError if ANTHROPIC_API_KEY is missing
 """
 
 from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
+
+
+def _env_number(name: str, default: str, kind: type[int] | type[float] = int) -> int | float:
+    """Read a numeric environment variable, naming it in the error if malformed."""
+    raw = os.environ.get(name, default)
+    try:
+        return kind(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {raw!r}.") from None
 
 
 @dataclass
@@ -30,15 +40,41 @@ class Settings:
         default_factory=lambda: os.environ.get("FLASK_DEBUG", "0") == "1"
     )
     port: int = field(
-        default_factory=lambda: int(os.environ.get("PORT", "5001"))
+        default_factory=lambda: _env_number("PORT", "5001")
     )
 
     # ── Search ──────────────────────────────────────────────────────────────
     max_search_results: int = field(
-        default_factory=lambda: int(os.environ.get("MAX_SEARCH_RESULTS", "10"))
+        default_factory=lambda: _env_number("MAX_SEARCH_RESULTS", "10")
     )
     max_web_searches: int = field(
-        default_factory=lambda: int(os.environ.get("MAX_WEB_SEARCHES", "1"))
+        default_factory=lambda: _env_number("MAX_WEB_SEARCHES", "1")
+    )
+    #: Number of search responses kept in memory (0 disables the cache).
+    search_cache_size: int = field(
+        default_factory=lambda: _env_number("SEARCH_CACHE_SIZE", "256")
+    )
+    #: Seconds a cached search response stays valid.
+    search_cache_ttl: int = field(
+        default_factory=lambda: _env_number("SEARCH_CACHE_TTL", "3600")
+    )
+
+    # ── Anthropic API limits ───────────────────────────────────────────────
+    #: Maximum Anthropic requests being opened at once across the process
+    #: (>= 1). A call holds its slot until its response starts; a stream
+    #: releases it once open, so this does not cap concurrent streams.
+    anthropic_max_concurrency: int = field(
+        default_factory=lambda: _env_number("ANTHROPIC_MAX_CONCURRENCY", "8")
+    )
+    #: Requests started per minute; ``0`` leaves the rate unlimited. Set this
+    #: to the account's tier limit to queue bursts locally rather than hit 429s.
+    anthropic_requests_per_minute: float = field(
+        default_factory=lambda: _env_number("ANTHROPIC_REQUESTS_PER_MINUTE", "0", float)
+    )
+    #: Seconds a call waits for a free request slot before raising
+    #: ``TimeoutError`` (> 0).
+    anthropic_slot_timeout: float = field(
+        default_factory=lambda: _env_number("ANTHROPIC_SLOT_TIMEOUT", "30", float)
     )
 
     # ── AI Models ───────────────────────────────────────────────────────────
@@ -47,6 +83,15 @@ class Settings:
     #: Model used for the summarisation / structuring pass.
     summary_model: str = "claude-haiku-4-5"
 
+    def __post_init__(self) -> None:
+        """Reject limit values that would stall or break every API call."""
+        if self.anthropic_max_concurrency < 1:
+            raise ValueError("ANTHROPIC_MAX_CONCURRENCY must be at least 1.")
+        if self.anthropic_requests_per_minute < 0:
+            raise ValueError("ANTHROPIC_REQUESTS_PER_MINUTE must not be negative.")
+        if self.anthropic_slot_timeout <= 0:
+            raise ValueError("ANTHROPIC_SLOT_TIMEOUT must be greater than 0.")
+
     def validate(self) -> None:
         """Raise ``ValueError`` if any required setting is missing."""
         if not self.anthropic_api_key:
@@ -54,3 +99,13 @@ class Settings:
                 "ANTHROPIC_API_KEY environment variable is not set. "
                 "Copy .env.example to .env and add your key."
             )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide ``Settings`` instance, reading the environment once.
+
+    Tests that change environment variables should call
+    ``get_settings.cache_clear()`` (or build a ``Settings()`` directly).
+    """
+    return Settings()
@@ -3,7 +3,9 @@ topic-radar core package.
 
 Modules
 ───────
+cache       — Thread-safe in-process TTL + LRU cache (TTLCache)
+client      — Shared, lazily created Anthropic SDK client (get_client)
 models      — Pydantic data models (TopicSummary, HistoryEntry, SourceRef)
 researcher  — Claude + web_search tool: research + structure pipeline
-history     — SQLite-backed search history (save, get_all, get_by_id, delete)
+history     — SQLite-backed search history (save, save_many, get_all, list_meta, get_by_id, delete)
 """
@@ -17,6 +17,10 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.search import SearchResult
 
 logger = logging.getLogger(__name__)
 
@@ -25,30 +29,47 @@ logger = logging.getLogger(__name__)
 
 #: Maps intent string → preferred display order for content type sections.
 #: First entry in each list is expanded by default in the UI.
-INTENT_PRIORITY: dict[str, list[str]] = {
-    "academic":    ["papers", "news", "discussions", "videos", "code"],
-    "tutorial":    ["news", "code", "discussions", "videos", "papers"],
-    "business":    ["news", "discussions", "papers", "videos", "code"],
-    "exploratory": ["news", "papers", "discussions", "videos", "code"],
+INTENT_PRIORITY: dict[str, tuple[str, ...]] = {
+    "academic":    ("papers", "news", "discussions", "videos", "code"),
+    "tutorial":    ("news", "code", "discussions", "videos", "papers"),
+    "business":    ("news", "discussions", "papers", "videos", "code"),
+    "exploratory": ("news", "papers", "discussions", "videos", "code"),
 }
 
 #: Fallback order when intent is unknown.
-_DEFAULT_PRIORITY: list[str] = INTENT_PRIORITY["exploratory"]
+_DEFAULT_PRIORITY: tuple[str, ...] = INTENT_PRIORITY["exploratory"]
+
+#: Per-intent content type → rank, precomputed from ``INTENT_PRIORITY``.
+_INTENT_RANK: dict[str, dict[str, int]] = {
+    intent: {content_type: rank for rank, content_type in enumerate(order)}
+    for intent, order in INTENT_PRIORITY.items()
+}
+_DEFAULT_RANK: dict[str, int] = _INTENT_RANK["exploratory"]
+
+#: Rank given to content types missing from an intent's priority list.
+_UNRANKED = len(_DEFAULT_PRIORITY)
 
 
 # ── Deduplication ──────────────────────────────────────────────────────────────
 
 
-def deduplicate(results: list[object]) -> list[object]:
+def _normalise_url(url: str) -> str:
+    """Return the comparison form of *url*: trailing slashes stripped, lowercased."""
+    return url.rstrip("/").lower()
+
+
+def deduplicate(results: list[SearchResult]) -> list[SearchResult]:
     """Remove duplicate search results by URL, keeping the first occurrence.
 
     Normalises URLs by stripping trailing slashes and lowercasing before
     comparison so that ``https://example.com/`` and ``https://example.com``
-    are treated as the same resource.
+    are treated as the same resource. Results with an empty URL are dropped.
+
+    Normalised URLs are tracked by their 64-bit ``hash()`` rather than kept
+    alive as strings; a collision needs ~2**32 distinct URLs in one call.
 
     Args:
-        results: List of ``SearchResult`` objects (typed as ``object`` to
-            avoid circular import; expects a ``.url`` attribute).
+        results: List of ``SearchResult`` objects.
 
     Returns:
         Deduplicated list in original order.
@@ -57,17 +78,17 @@ def deduplicate(results: list[object]) -> list[object]:
         >>> len(deduplicate([r1, r2, r1]))  # r1 duplicated
         2
     """
-    seen: set[str] = set()
-    unique: list[object] = []
+    unique: dict[int, SearchResult] = {}
 
     for result in results:
-        url: str = getattr(result, "url", "") or ""
-        normalised = url.rstrip("/").lower()
-        if normalised and normalised not in seen:
-            seen.add(normalised)
-            unique.append(result)
+        normalised = _normalise_url(result.url or "")
+        if not normalised:
+            continue
+        key = hash(normalised)
+        if key not in unique:
+            unique[key] = result
 
-    return unique
+    return list(unique.values())
 
 
 # ── Grouping ───────────────────────────────────────────────────────────────────
@@ -100,7 +121,7 @@ def prioritize_sections(
     """Order content sections by intent-based priority.
 
     Sections with zero results are omitted. Sections not listed in the intent
-    priority map are appended at the end in arbitrary order.
+    priority map are appended at the end in their original order.
 
     Args:
         grouped: Dict mapping content_type → results (from ``group_by_type``).
@@ -113,36 +134,29 @@ def prioritize_sections(
         >>> prioritize_sections({"papers": [...], "news": [...]}, "academic")
         [("papers", [...]), ("news", [...])]
     """
-    priority_order = INTENT_PRIORITY.get(intent, _DEFAULT_PRIORITY)
+    ranks = _INTENT_RANK.get(intent, _DEFAULT_RANK)
 
-    ordered: list[tuple[str, list[object]]] = []
-    appended_types: set[str] = set()
-
-    # First: add sections in priority order (skip empty ones)
-    for content_type in priority_order:
-        if content_type in grouped and grouped[content_type]:
-            ordered.append((content_type, grouped[content_type]))
-            appended_types.add(content_type)
-
-    # Then: append any remaining types not in the priority list
-    for content_type, results in grouped.items():
-        if content_type not in appended_types and results:
-            ordered.append((content_type, results))
-
-    return ordered
+    # sorted() is stable, so unranked types keep their grouping order at the end
+    return sorted(
+        ((content_type, results) for content_type, results in grouped.items() if results),
+        key=lambda section: ranks.get(section[0], _UNRANKED),
+    )
 
 
 # ── Public pipeline ────────────────────────────────────────────────────────────
 
 
 def aggregate(
-    results: list[object],
+    results: list[SearchResult],
     intent: str,
     max_results: int = 10,
-) -> list[tuple[str, list[object]]]:
+) -> list[tuple[str, list[SearchResult]]]:
     """Full aggregation pipeline: deduplicate → group → prioritise.
 
-    This is the single entry point used by ``web/app.py``.
+    This is the single entry point used by ``web/app.py``. Deduplication and
+    grouping are fused into one pass over *results* that stops as soon as
+    *max_results* unique results have been collected; the output matches
+    ``prioritize_sections(group_by_type(deduplicate(results)[:max_results]))``.
 
     Args:
         results: Raw ``SearchResult`` list from the search pass.
@@ -153,6 +167,21 @@ def aggregate(
         Prioritised list of ``(content_type, results)`` tuples, each section
         ordered highest-priority first.
     """
-    unique = deduplicate(results)[:max_results]
-    grouped = group_by_type(unique)
-    return prioritize_sections(grouped, intent)
+    seen: set[int] = set()
+    grouped: dict[str, list[SearchResult]] = defaultdict(list)
+    count = 0
+
+    for result in results:
+        if count >= max_results:
+            break
+        normalised = _normalise_url(result.url or "")
+        if not normalised:
+            continue
+        key = hash(normalised)
+        if key in seen:
+            continue
+        seen.add(key)
+        grouped[result.content_type or "news"].append(result)
+        count += 1
+
+    return prioritize_sections(dict(grouped), intent)
@@ -0,0 +1,68 @@
+"""Small in-process TTL + LRU cache.
+
+Used to memoise expensive Claude calls (a web search costs seconds and real
+money) for repeated queries — page refreshes, shared links, back/forward
+navigation. Deliberately stdlib-only: a single-process Flask app does not
+need an external cache server.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe mapping whose entries expire after *ttl* seconds.
+
+    Once *maxsize* entries are held, the least recently used one is evicted.
+    Expired entries are dropped lazily when they are next looked up.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialise the cache.
+
+        Args:
+            maxsize: Maximum number of entries; ``0`` disables caching.
+            ttl: Entry lifetime in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the live value for *key*, or ``None`` on a miss."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store *value* under *key*, evicting the oldest entry if full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -15,7 +15,13 @@ from __future__ import annotations
 import logging
 import re
 from enum import Enum
-from urllib.parse import urlparse
+from functools import cache, lru_cache
+from urllib.parse import urlsplit
+
+try:
+    import ahocorasick  # Optional: pyahocorasick speeds up keyword matching
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +68,7 @@ _DISCUSSION_DOMAINS: frozenset[str] = frozenset([
     "reddit.com", "news.ycombinator.com", "stackoverflow.com",
     "stackexchange.com", "quora.com", "lobste.rs", "dev.to",
     "forum.fast.ai", "discuss.pytorch.org", "discourse.julialang.org",
+    "discuss.huggingface.co",
 ])
 
 _VIDEO_DOMAINS: frozenset[str] = frozenset([
@@ -75,10 +82,91 @@ _CODE_DOMAINS: frozenset[str] = frozenset([
     "pypi.org", "npmjs.com",
 ])
 
+#: Hosts that only publish news/articles. Results from these skip the
+#: title/snippet heuristics, which would otherwise misfire on words like
+#: "video" or "talk" in a headline.
+_CONFIRMED_NEWS_DOMAINS: frozenset[str] = frozenset([
+    "techcrunch.com", "theverge.com", "wired.com", "arstechnica.com",
+    "venturebeat.com", "engadget.com", "zdnet.com", "technologyreview.com",
+    "reuters.com", "apnews.com", "bloomberg.com", "cnbc.com", "axios.com",
+    "nytimes.com", "wsj.com", "ft.com", "theguardian.com", "bbc.com",
+    "bbc.co.uk", "cnn.com", "forbes.com", "businessinsider.com",
+    "spectrum.ieee.org", "cacm.acm.org",
+])
+
+#: Flattened domain → type lookup so classification is a hash probe per label.
+#: Confirmed news hosts map to NEWS; hosts absent from the table are unknown.
+_DOMAIN_TO_TYPE: dict[str, ContentType] = (
+    {domain: ContentType.NEWS for domain in _CONFIRMED_NEWS_DOMAINS}
+    | {domain: ContentType.PAPERS for domain in _PAPER_DOMAINS}
+    | {domain: ContentType.DISCUSSIONS for domain in _DISCUSSION_DOMAINS}
+    | {domain: ContentType.VIDEOS for domain in _VIDEO_DOMAINS}
+    | {domain: ContentType.CODE for domain in _CODE_DOMAINS}
+)
+
+
+#: Site families whose subdomains are all the same kind of site, so that
+#: ``old.reddit.com`` or ``news.bbc.co.uk`` match their parent. Umbrella
+#: domains such as ``ieee.org`` or ``huggingface.co`` host mixed sites
+#: (``spectrum.ieee.org`` is news, ``discuss.huggingface.co`` a forum), so
+#: they are left out and only their exactly-listed hosts match.
+_SITE_FAMILIES: frozenset[str] = _CONFIRMED_NEWS_DOMAINS | frozenset([
+    "arxiv.org", "biorxiv.org", "medrxiv.org", "openreview.net",
+    "reddit.com", "stackexchange.com", "quora.com",
+    "youtube.com", "vimeo.com", "twitch.tv",
+])
+
 
 # ── URL-based classification ───────────────────────────────────────────────────
 
 
+@lru_cache(maxsize=4096)
+def _url_domain(url: str) -> str:
+    """Return the lowercased host of *url* without ``www.``; ``""`` if unparseable.
+
+    Plain ``scheme://host/...`` URLs — nearly every search result — are sliced
+    directly; anything with credentials, an IPv6 literal or no scheme goes
+    through ``urlsplit``. Memoised per URL, since the same URLs recur across
+    repeated and refreshed searches.
+    """
+    i = url.find("://")
+    if i > 0 and url[:i].isalpha():
+        start = i + 3
+        end = len(url)
+        for sep in "/?#":
+            j = url.find(sep, start, end)
+            if j != -1:
+                end = j
+        host = url[start:end]
+        if "@" not in host and "[" not in host:
+            return host.lower().removeprefix("www.")
+    try:
+        return urlsplit(url).netloc.lower().removeprefix("www.")
+    except ValueError:
+        logger.debug("Failed to parse URL for classification: %r", url)
+        return ""
+
+
+@lru_cache(maxsize=4096)
+def _domain_type(domain: str) -> ContentType | None:
+    """Return the listed type for *domain*, or for its site family.
+
+    Exact listings win. Otherwise labels are stripped from the left one at a
+    time, and the first parent in ``_SITE_FAMILIES`` supplies the type, so
+    ``old.reddit.com`` and ``cs.stackexchange.com`` match their parent sites
+    while ``spectrum.ieee.org`` does not inherit ``ieee.org``.
+    """
+    content_type = _DOMAIN_TO_TYPE.get(domain)
+    if content_type is not None:
+        return content_type
+    _, _, parent = domain.partition(".")
+    while "." in parent:  # Never fall back to a bare TLD
+        if parent in _SITE_FAMILIES:
+            return _DOMAIN_TO_TYPE[parent]
+        _, _, parent = parent.partition(".")
+    return None
+
+
 def classify_url(url: str) -> ContentType:
     """Classify a URL into a ``ContentType`` based on its domain.
 
@@ -96,51 +184,98 @@ def classify_url(url: str) -> ContentType:
         >>> classify_url("https://github.com/anthropics/anthropic-sdk-python")
         <ContentType.CODE: 'code'>
     """
-    try:
-        domain = urlparse(url).netloc.lower().lstrip("www.")
-    except Exception:
-        logger.debug("Failed to parse URL for classification: %r", url)
-        return ContentType.UNKNOWN
-
+    domain = _url_domain(url)
     if not domain:
         return ContentType.UNKNOWN
 
-    if domain in _PAPER_DOMAINS:
-        return ContentType.PAPERS
-    if domain in _DISCUSSION_DOMAINS:
-        return ContentType.DISCUSSIONS
-    if domain in _VIDEO_DOMAINS:
-        return ContentType.VIDEOS
-    if domain in _CODE_DOMAINS:
-        return ContentType.CODE
-
-    return ContentType.NEWS  # Default: assume a news article or blog post
+    # Default: assume a news article or blog post
+    return _domain_type(domain) or ContentType.NEWS
 
 
 # ── Text-based heuristics (fallback) ──────────────────────────────────────────
 
-_PAPER_RE = re.compile(
-    r"\b(?:arxiv|preprint|doi|abstract|methodology|findings|peer.reviewed"
-    r"|proceedings|conference paper)\b",
-    re.IGNORECASE,
-)
-_DISCUSSION_RE = re.compile(
-    r"\b(?:reddit|thread|discussion|comment|ama|posted|r/|upvote)\b",
-    re.IGNORECASE,
-)
-_VIDEO_RE = re.compile(
-    r"\b(?:youtube|video|watch|episode|podcast|lecture|talk)\b",
-    re.IGNORECASE,
-)
-_CODE_RE = re.compile(
-    r"\b(?:github|repo|repository|package|library|snippet|npm|pip install)\b",
-    re.IGNORECASE,
-)
+#: Keywords per category, in match-priority order. Entries are regex
+#: fragments; only ``peer.reviewed`` uses a metacharacter (any separator).
+_CATEGORY_KEYWORDS: dict[ContentType, tuple[str, ...]] = {
+    ContentType.PAPERS: (
+        "arxiv", "preprint", "doi", "abstract", "methodology", "findings",
+        "peer.reviewed", "proceedings", "conference paper",
+    ),
+    ContentType.DISCUSSIONS: (
+        "reddit", "thread", "discussion", "comment", "ama", "posted", "r/", "upvote",
+    ),
+    ContentType.VIDEOS: (
+        "youtube", "video", "watch", "episode", "podcast", "lecture", "talk",
+    ),
+    ContentType.CODE: (
+        "github", "repo", "repository", "package", "library", "snippet", "npm",
+        "pip install",
+    ),
+}
+
+
+@cache
+def _category_re() -> re.Pattern[str]:
+    """Return the category keyword regex, compiled on first use.
+
+    A single alternation over every category's keywords. Each named group
+    matches a ``ContentType`` value, so ``match.lastgroup`` identifies the
+    category in one scan instead of one scan per category. It is matched
+    against lowercased text: ``re.IGNORECASE`` makes the scan ~2× slower.
+    """
+    groups = "|".join(
+        f"(?P<{content_type.value}>{'|'.join(keywords)})"
+        for content_type, keywords in _CATEGORY_KEYWORDS.items()
+    )
+    return re.compile(rf"\b(?:{groups})\b")
+
+
+@cache
+def _keyword_automaton() -> object:
+    """Return an Aho-Corasick automaton over every keyword's literal prefix.
+
+    Returns ``None`` when ``pyahocorasick`` is not installed, in which case
+    ``_first_category`` falls back to ``_category_re().search``.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keywords in _CATEGORY_KEYWORDS.values():
+        for keyword in keywords:
+            prefix = keyword.split(".", 1)[0]  # Literal part of "peer.reviewed"
+            automaton.add_word(prefix, len(prefix))
+    automaton.make_automaton()
+    return automaton
+
+
+def _first_category(text: str) -> str | None:
+    """Return the category of the earliest keyword in lowercased *text*.
+
+    With the automaton, one pass finds every position where a keyword could
+    start, and the regex only confirms those few candidates (word boundaries,
+    alternation order) — far cheaper than letting it try every position.
+    Both paths return the same answer.
+    """
+    pattern = _category_re()
+    automaton = _keyword_automaton()
+    if automaton is None:
+        match = pattern.search(text)
+        return match.lastgroup if match else None
+
+    starts = sorted({end - length + 1 for end, length in automaton.iter(text)})
+    for start in starts:
+        match = pattern.match(text, start)
+        if match:
+            return match.lastgroup
+    return None
 
 
 def classify_by_text(title: str, snippet: str) -> ContentType:
     """Classify content using title and snippet heuristics when URL fails.
 
+    The title is scanned first; the snippet is only scanned when the title
+    carries no keyword. Within a single string the earliest keyword wins.
+
     Args:
         title: The result title.
         snippet: The result preview/snippet text.
@@ -148,18 +283,10 @@ def classify_by_text(title: str, snippet: str) -> ContentType:
     Returns:
         The inferred ``ContentType``.
     """
-    combined = f"{title} {snippet}"
-
-    if _PAPER_RE.search(combined):
-        return ContentType.PAPERS
-    if _DISCUSSION_RE.search(combined):
-        return ContentType.DISCUSSIONS
-    if _VIDEO_RE.search(combined):
-        return ContentType.VIDEOS
-    if _CODE_RE.search(combined):
-        return ContentType.CODE
-
-    return ContentType.NEWS
+    category = _first_category(title.lower()) or _first_category(snippet.lower())
+    if category is None:
+        return ContentType.NEWS
+    return ContentType(category)
 
 
 # ── Public interface ───────────────────────────────────────────────────────────
@@ -168,7 +295,8 @@ def classify_by_text(title: str, snippet: str) -> ContentType:
 def classify_result(result: object) -> ContentType:
     """Classify a search result into a ``ContentType``.
 
-    Tries URL-based classification first; falls back to title/snippet heuristics.
+    Tries URL-based classification first; falls back to title/snippet heuristics
+    unless the host is a known news publisher.
 
     Args:
         result: A ``SearchResult`` instance (typed as ``object`` to avoid a
@@ -181,11 +309,14 @@ def classify_result(result: object) -> ContentType:
     title: str = getattr(result, "title", "") or ""
     snippet: str = getattr(result, "snippet", "") or ""
 
-    content_type = classify_url(url)
-    if content_type != ContentType.NEWS:
-        # URL matched a specific domain pattern — trust it
+    domain = _url_domain(url)
+    if not domain:
+        return ContentType.UNKNOWN
+
+    content_type = _domain_type(domain)
+    if content_type is not None:
+        # Listed domain (including confirmed news hosts) — trust it
         return content_type
 
-    # URL defaulted to NEWS; try text heuristics to see if it's something else
-    text_type = classify_by_text(title, snippet)
-    return text_type
+    # Unlisted domain; try text heuristics to see if it's more than news
+    return classify_by_text(title, snippet)
@@ -0,0 +1,184 @@
+"""Shared Anthropic SDK client.
+
+Every module that talks to Claude goes through :func:`get_client`, so the
+process holds one client — and one HTTP connection pool — per API key.
+Keep-alive connections are then reused across searches, summaries and
+research calls instead of paying a fresh TCP + TLS handshake each time.
+
+Calls are also throttled through :func:`get_limiter`, which bounds how many
+requests are being opened at once and (optionally) how many start per
+minute, so bursts queue locally instead of triggering 429 retries with
+back-off. A call holds its slot until its response starts: a plain call
+until it returns, a streaming call (via :func:`opened_stream`) only until
+the stream is open, so long or slowly-read streams never pin a slot.
+Its limits come from ``config.settings`` (``ANTHROPIC_MAX_CONCURRENCY``,
+``ANTHROPIC_REQUESTS_PER_MINUTE`` and ``ANTHROPIC_SLOT_TIMEOUT``).
+
+The SDK import is deferred to the first call so that importing ``core``
+stays cheap and tests can run without a live API key.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    import anthropic
+
+_T = TypeVar("_T")
+
+#: Retries with SDK back-off, mainly for 429s after the heavier search call.
+MAX_RETRIES = 5
+
+
+@lru_cache(maxsize=8)
+def get_client(api_key: str) -> anthropic.Anthropic:
+    """Return the process-wide Anthropic client for *api_key*.
+
+    Args:
+        api_key: Anthropic API key. Each distinct key gets its own client.
+
+    Returns:
+        A sync ``anthropic.Anthropic`` client, created on first use.
+    """
+    import anthropic  # Deferred: the SDK is slow to import
+
+    return anthropic.Anthropic(api_key=api_key, max_retries=MAX_RETRIES)
+
+
+def cached_system(text: str) -> list[dict]:
+    """Wrap a system prompt as a text block marked for prompt caching.
+
+    Build these once per prompt, so repeat calls send an identical prefix and
+    reuse Anthropic's cached copy of it.
+    """
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+# ── Rate limiting ──────────────────────────────────────────────────────────────
+
+
+class RateLimiter:
+    """Thread-safe concurrency cap plus token-bucket rate limit.
+
+    Usage::
+
+        with get_limiter().slot():
+            client.messages.create(...)
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        requests_per_minute: float = 0,
+        timeout: float | None = None,
+    ) -> None:
+        """Initialise the limiter.
+
+        Args:
+            max_concurrent: Maximum number of slots held at the same time.
+            requests_per_minute: Sustained rate at which slots may be taken;
+                ``0`` disables the rate limit. Up to *max_concurrent* requests
+                may start in a burst.
+            timeout: Seconds ``slot()`` waits before raising ``TimeoutError``;
+                ``None`` waits indefinitely.
+
+        Raises:
+            ValueError: If *max_concurrent* is below 1 or the rate is negative.
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1.")
+        if requests_per_minute < 0:
+            raise ValueError("requests_per_minute must not be negative.")
+        self._max_concurrent = max_concurrent
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._rate = requests_per_minute / 60.0  # Tokens per second
+        self._capacity = float(max_concurrent)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.timeout = timeout
+
+    def _take_token(self, deadline: float | None) -> bool:
+        """Wait for a request token and consume it.
+
+        Returns:
+            ``False`` if no token would be available before *deadline*.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self._rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one request slot for the duration of the ``with`` block.
+
+        Raises:
+            TimeoutError: If no slot (or rate token) frees up within ``timeout``.
+        """
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError(
+                f"No Anthropic request slot freed up within {self.timeout:g}s "
+                f"({self._max_concurrent} calls already being opened)."
+            )
+        try:
+            if self._rate > 0 and not self._take_token(deadline):
+                raise TimeoutError(
+                    f"Anthropic request rate limit would delay this call past "
+                    f"{self.timeout:g}s."
+                )
+            yield
+        finally:
+            self._slots.release()
+
+
+@lru_cache(maxsize=1)
+def get_limiter() -> RateLimiter:
+    """Return the process-wide limiter shared by every Anthropic call in ``core``.
+
+    Built on first use from ``config.settings``, so invalid limits surface as a
+    clear ``ValueError`` from the settings rather than at import time.
+    """
+    from config.settings import get_settings
+
+    settings = get_settings()
+    return RateLimiter(
+        settings.anthropic_max_concurrency,
+        settings.anthropic_requests_per_minute,
+        timeout=settings.anthropic_slot_timeout,
+    )
+
+
+@contextmanager
+def opened_stream(manager: AbstractContextManager[_T]) -> Iterator[_T]:
+    """Enter an SDK stream *manager*, holding a limiter slot only while it opens.
+
+    Usage::
+
+        with opened_stream(client.messages.stream(...)) as stream:
+            for event in stream: ...
+
+    Raises:
+        TimeoutError: If no slot frees up within the limiter's timeout.
+    """
+    with ExitStack() as stack:
+        with get_limiter().slot():
+            stream = stack.enter_context(manager)
+        yield stream
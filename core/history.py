@@ -6,19 +6,26 @@ Schema
 table: searches
   id         INTEGER PRIMARY KEY AUTOINCREMENT
   topic      TEXT NOT NULL
-  created_at TEXT NOT NULL  (ISO-8601 UTC)
+  created_at INTEGER NOT NULL  (Unix epoch, microseconds, UTC)
   summary    TEXT NOT NULL  (TopicSummary serialised as JSON)
+  content_hash BLOB UNIQUE  (16-byte BLAKE2b of topic + summary; NULL for
+                             rows saved before de-duplication existed)
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import sqlite3
+import threading
+import time
+from collections.abc import Iterable
 from contextlib import contextmanager
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import NamedTuple
 
 from core.models import HistoryEntry, TopicSummary
 
@@ -27,69 +34,282 @@ logger = logging.getLogger(__name__)
 DEFAULT_DB_PATH = Path(__file__).parent.parent / "data" / "history.db"
 
 
+class HistoryMeta(NamedTuple):
+    """Lightweight history row for list views — no summary payload."""
+
+    id: int
+    topic: str
+    created_at: datetime
+
+
 def _db_path() -> Path:
     """Return the database file path, honouring a DB_PATH env var if set."""
     env = os.getenv("DB_PATH")
     return Path(env) if env else DEFAULT_DB_PATH
 
 
-@contextmanager
-def _connect():
-    """Yield a connected sqlite3.Connection, creating the file/dir if needed."""
+#: Pragmas applied once when the shared connection is opened.
+_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",      # ~20 MB page cache
+    "PRAGMA mmap_size=268435456",    # 256 MB memory-mapped I/O
+)
+
+_conn: sqlite3.Connection | None = None
+_conn_path: Path | None = None
+_lock = threading.RLock()
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Return the shared connection, (re)opening it if DB_PATH has changed.
+
+    Must be called with ``_lock`` held.
+    """
+    global _conn, _conn_path
+
     path = _db_path()
+    if _conn is not None and _conn_path == path:
+        return _conn
+
+    if _conn is not None:
+        _conn.close()
+
     path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(path))
+    conn = sqlite3.connect(str(path), check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+
+    _conn, _conn_path = conn, path
+    return conn
+
+
+def _reset_connection() -> None:
+    """Close the shared connection; the next query reopens it.
+
+    Tests call this after pointing ``DB_PATH`` at a temporary file so no
+    handle outlives the file it was opened on.
+    """
+    global _conn, _conn_path
+
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+        _conn, _conn_path = None, None
+
+
+@contextmanager
+def _connect():
+    """Yield the shared sqlite3.Connection inside a transaction.
+
+    The connection is opened once per process (per DB path) in WAL mode and
+    guarded by a lock, so callers avoid the open/close cost on every query.
+    """
+    with _lock:
+        conn = _get_conn()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS searches (
+        id         INTEGER PRIMARY KEY AUTOINCREMENT,
+        topic      TEXT NOT NULL,
+        created_at INTEGER NOT NULL,
+        summary    TEXT NOT NULL,
+        content_hash BLOB
+    )
+"""
+
+_CREATE_INDEXES: tuple[str, ...] = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_searches_content_hash ON searches(content_hash)",
+    "CREATE INDEX IF NOT EXISTS ix_searches_created_at ON searches(created_at)",
+)
+
+#: Re-saving identical content refreshes the existing row's timestamp instead
+#: of storing the summary again.
+_UPSERT = (
+    "INSERT INTO searches (topic, created_at, summary, content_hash) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(content_hash) DO UPDATE SET created_at = excluded.created_at"
+)
+
+
+def _now_us() -> int:
+    """Return the current UTC time as integer microseconds since the epoch."""
+    return time.time_ns() // 1000
+
+
+def _to_us(value: datetime) -> int:
+    """Convert an aware datetime into integer microseconds since the epoch."""
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_us(value: int) -> datetime:
+    """Convert a stored ``created_at`` value back into an aware UTC datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _content_hash(topic: str, summary_json: str) -> bytes:
+    """Return the de-duplication key for a topic and its serialised summary."""
+    digest = hashlib.blake2b(topic.encode(), digest_size=16)
+    digest.update(b"\0")
+    digest.update(summary_json.encode())
+    return digest.digest()
+
+
+def _add_content_hash_column(conn: sqlite3.Connection) -> None:
+    """Add ``content_hash`` to tables created before saves were de-duplicated.
+
+    Existing rows keep a NULL hash (NULLs never conflict under UNIQUE), so
+    only entries saved from now on are de-duplicated.
+    """
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(searches)")}
+    if "content_hash" not in columns:
+        conn.execute("ALTER TABLE searches ADD COLUMN content_hash BLOB")
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection):
+    """Run the enclosed statements as one explicit transaction.
+
+    sqlite3 only opens a transaction implicitly before DML, so without this
+    each schema change would commit on its own and a failure part-way through
+    a table rebuild would leave the database half-migrated.
+    """
+    conn.execute("BEGIN")
     try:
-        yield conn
-        conn.commit()
-    except Exception:
+        yield
+    except BaseException:
         conn.rollback()
         raise
-    finally:
-        conn.close()
+    conn.commit()
+
+
+def _iso_to_us(value: str) -> int:
+    """Convert a legacy ISO-8601 ``created_at`` string into epoch microseconds.
+
+    Naive values are taken to be UTC, as the old schema documented.
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return _to_us(parsed)
+
+
+def _legacy_rows(conn: sqlite3.Connection) -> list[tuple[int, str, int, str]]:
+    """Read every row of a TEXT-timestamp ``searches`` table, converting ``created_at``.
+
+    Raises:
+        ValueError: If any timestamp cannot be parsed. Nothing has been
+            modified at that point, so no history is lost.
+    """
+    rows = conn.execute("SELECT id, topic, created_at, summary FROM searches").fetchall()
+    return [
+        (row["id"], row["topic"], _iso_to_us(row["created_at"]), row["summary"])
+        for row in rows
+    ]
+
+
+def _migrate_text_timestamps(conn: sqlite3.Connection) -> None:
+    """Rebuild a pre-epoch ``searches`` table whose ``created_at`` is ISO TEXT.
+
+    A TEXT column would coerce integers back to strings, so the table is
+    recreated with an INTEGER column and every timestamp is converted. All
+    rows are converted before the schema is touched, and the rebuild runs in
+    a single transaction, so a failure leaves the original table intact.
+    """
+    columns = {row["name"]: row["type"] for row in conn.execute("PRAGMA table_info(searches)")}
+    if columns.get("created_at", "").upper() != "TEXT":
+        return
+
+    rows = _legacy_rows(conn)
+    with _transaction(conn):
+        conn.execute("ALTER TABLE searches RENAME TO searches_old")
+        conn.execute(_CREATE_TABLE)
+        conn.executemany(
+            "INSERT INTO searches (id, topic, created_at, summary) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        conn.execute("DROP TABLE searches_old")
+    logger.info("Migrated %d history entries to epoch timestamps", len(rows))
 
 
 def init_db() -> None:
-    """Create the searches table if it doesn't exist yet."""
+    """Create the searches table and its indexes if they don't exist yet.
+
+    Databases created before timestamps were stored as epoch integers, or
+    before saves were de-duplicated, are migrated in place.
+    """
     with _connect() as conn:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS searches (
-                id         INTEGER PRIMARY KEY AUTOINCREMENT,
-                topic      TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                summary    TEXT NOT NULL
-            )
-            """
-        )
+        conn.execute(_CREATE_TABLE)
+        _migrate_text_timestamps(conn)
+        _add_content_hash_column(conn)
+        for statement in _CREATE_INDEXES:
+            conn.execute(statement)
     logger.info("History DB initialised at %s", _db_path())
 
 
 def save(topic: str, summary: TopicSummary) -> int:
-    """Persist a research result and return its new row ID.
+    """Persist a research result and return its row ID.
+
+    Saving a topic and summary identical to an existing entry does not add a
+    row; the existing entry's timestamp is refreshed so it lists as newest.
 
     Args:
         topic: The search topic string.
         summary: The structured TopicSummary to store.
 
     Returns:
-        The integer primary key of the inserted row.
+        The integer primary key of the new or refreshed row.
     """
-    now = datetime.now(timezone.utc).isoformat()
+    now = _now_us()
     summary_json = summary.model_dump_json()
+    content_hash = _content_hash(topic, summary_json)
 
     with _connect() as conn:
-        cursor = conn.execute(
-            "INSERT INTO searches (topic, created_at, summary) VALUES (?, ?, ?)",
-            (topic, now, summary_json),
-        )
-        row_id = cursor.lastrowid
+        conn.execute(_UPSERT, (topic, now, summary_json, content_hash))
+        # lastrowid is unreliable when the upsert updated instead of inserting
+        row_id = conn.execute(
+            "SELECT id FROM searches WHERE content_hash = ?", (content_hash,),
+        ).fetchone()["id"]
 
     logger.info("Saved history entry id=%d for topic=%r", row_id, topic)
     return row_id
 
 
+def save_many(items: Iterable[tuple[str, TopicSummary]]) -> int:
+    """Persist several research results in a single transaction.
+
+    Uses ``executemany`` so the whole batch pays for one commit instead of
+    one per row. Duplicates are de-duplicated as in ``save``.
+
+    Args:
+        items: ``(topic, summary)`` pairs to store.
+
+    Returns:
+        The number of rows inserted or refreshed.
+    """
+    now = _now_us()
+    rows = []
+    for topic, summary in items:
+        summary_json = summary.model_dump_json()
+        rows.append((topic, now, summary_json, _content_hash(topic, summary_json)))
+
+    with _connect() as conn:
+        conn.executemany(_UPSERT, rows)
+
+    logger.info("Saved %d history entries", len(rows))
+    return len(rows)
+
+
 def get_all(limit: int = 50) -> list[HistoryEntry]:
     """Return the most recent *limit* history entries (newest first).
 
@@ -102,7 +322,7 @@ def get_all(limit: int = 50) -> list[HistoryEntry]:
     with _connect() as conn:
         rows = conn.execute(
             "SELECT id, topic, created_at, summary FROM searches "
-            "ORDER BY id DESC LIMIT ?",
+            "ORDER BY created_at DESC, id DESC LIMIT ?",
             (limit,),
         ).fetchall()
 
@@ -114,7 +334,7 @@ def get_all(limit: int = 50) -> list[HistoryEntry]:
                 HistoryEntry(
                     id=row["id"],
                     topic=row["topic"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
+                    created_at=_from_us(row["created_at"]),
                     summary=summary,
                 )
             )
@@ -124,6 +344,31 @@ def get_all(limit: int = 50) -> list[HistoryEntry]:
     return entries
 
 
+def list_meta(limit: int = 50) -> list[HistoryMeta]:
+    """Return id/topic/timestamp for the most recent *limit* entries (newest first).
+
+    Unlike ``get_all`` this never reads or validates the summary JSON, so it
+    is the cheap option for history list views.
+
+    Args:
+        limit: Maximum number of entries to return.
+
+    Returns:
+        A list of HistoryMeta tuples.
+    """
+    with _connect() as conn:
+        rows = conn.execute(
+            "SELECT id, topic, created_at FROM searches "
+            "ORDER BY created_at DESC, id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+
+    return [
+        HistoryMeta(row["id"], row["topic"], _from_us(row["created_at"]))
+        for row in rows
+    ]
+
+
 def get_by_id(entry_id: int) -> HistoryEntry | None:
     """Fetch a single history entry by its primary key.
 
@@ -146,7 +391,7 @@ def get_by_id(entry_id: int) -> HistoryEntry | None:
     return HistoryEntry(
         id=row["id"],
         topic=row["topic"],
-        created_at=datetime.fromisoformat(row["created_at"]),
+        created_at=_from_us(row["created_at"]),
         summary=summary,
     )
 
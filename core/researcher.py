@@ -11,22 +11,34 @@ Flow
      → captures web sources from server_tool_use events
      → returns the complete (text, sources) pair when exhausted
 
-2. structure(topic, raw_text, sources)
-     → second Claude call (fast, non-streaming) to convert the free-form
+2. structure_streaming(topic, raw_text, sources) / structure(...)
+     → second Claude call (fast, streamed) to convert the free-form
        research text into a validated TopicSummary JSON object via Pydantic
+     → skipped when the report's markdown sections can be extracted directly
+
+3. research_many(topics)
+     → runs research() for several topics on a bounded thread pool
 """
 
 from __future__ import annotations
 
+import io
+import json
 import logging
 import os
-from collections.abc import Generator
-
-import anthropic
-from pydantic import ValidationError
-
+import re
+import time
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING
+
+from core.client import cached_system, get_client, opened_stream
 from core.models import SourceRef, TopicSummary
 
+if TYPE_CHECKING:
+    import anthropic
+
 logger = logging.getLogger(__name__)
 
 RESEARCH_MODEL  = "claude-haiku-4-5"   # fast + high rate limits for web search pass
@@ -68,23 +80,177 @@ STRUCTURE_SYSTEM = (
 )
 
 
+#: Prebuilt system blocks, so repeat calls reuse the cached prompt prefix.
+_LENS_SYSTEM_BLOCKS: dict[str, list[dict]] = {
+    lens: cached_system(text) for lens, text in LENS_SYSTEMS.items()
+}
+_STRUCTURE_SYSTEM_BLOCKS: list[dict] = cached_system(STRUCTURE_SYSTEM)
+
+#: Formats one ``SourceRef`` as a bullet line for the structuring prompt.
+_format_source = "- {0.title}: {0.url}".format
+
+
+@lru_cache(maxsize=1)
+def _topic_summary_format() -> dict:
+    """Return the structured-output format for TopicSummary, built once.
+
+    Passing the model via ``output_format=`` makes the SDK regenerate and
+    transform its JSON schema on every call.
+    """
+    from anthropic import transform_schema
+
+    return {
+        "type": "json_schema",
+        "schema": transform_schema(TopicSummary.model_json_schema()),
+    }
+
+
+# ── Client ─────────────────────────────────────────────────────────────────
+
+def _client() -> anthropic.Anthropic:
+    """Return the shared Anthropic client for the configured API key."""
+    return get_client(os.environ["ANTHROPIC_API_KEY"])
+
+
 # ── Streaming research ─────────────────────────────────────────────────────
 
+#: Maximum number of web sources captured per research session.
+MAX_SOURCES = 5
+
+#: Signature shared by the stream event handlers below.
+_EventHandler = Callable[
+    [object, dict[str, SourceRef], io.StringIO | None],
+    Iterator[tuple[str, object]],
+]
+
+#: Internal events from ``_stream_events``; ``_coalesce_tokens`` consumes them.
+_TICK = "tick"    # Sent after every SDK event, so the flush deadline is re-checked
+_FLUSH = "flush"  # A content block ended (e.g. text before a web search)
+
+
+def _on_block_start(
+    event: object,
+    sources: dict[str, SourceRef],
+    text_buf: io.StringIO | None,  # noqa: ARG001  (uniform handler signature)
+) -> Iterator[tuple[str, object]]:
+    """Capture new web sources from a ``web_search_tool_result`` block.
+
+    *sources* is keyed by URL, so a page returned by several searches is only
+    captured (and yielded) once and duplicates never eat into ``MAX_SOURCES``.
+    """
+    block = event.content_block
+    if block.type != "web_search_tool_result" or not isinstance(block.content, list):
+        return  # Other block types, or a search error payload
+    for result in block.content:
+        if len(sources) >= MAX_SOURCES:
+            return
+        if result.type != "web_search_result":
+            continue
+        url = result.url or ""
+        if url and url not in sources:
+            src = SourceRef(
+                title=result.title or "",
+                url=url,
+                snippet=result.page_age or "",
+            )
+            sources[url] = src
+            yield ("source", src)
+
+
+def _on_block_delta(
+    event: object,
+    sources: dict[str, SourceRef],  # noqa: ARG001  (uniform handler signature)
+    text_buf: io.StringIO | None,
+) -> Iterator[tuple[str, object]]:
+    """Stream text tokens from a ``text_delta``, buffering them if requested."""
+    delta = event.delta
+    if delta.type == "text_delta":
+        chunk = delta.text
+        if text_buf is not None:
+            text_buf.write(chunk)
+        yield ("token", chunk)
+
+
+def _on_block_stop(
+    event: object,  # noqa: ARG001  (uniform handler signature)
+    sources: dict[str, SourceRef],  # noqa: ARG001
+    text_buf: io.StringIO | None,  # noqa: ARG001
+) -> Iterator[tuple[str, object]]:
+    """Mark the end of a content block so buffered text is sent straight away."""
+    yield (_FLUSH, None)
+
+
+#: Stream event type → handler. Events with no entry are ignored.
+_EVENT_HANDLERS: dict[str, _EventHandler] = {
+    "content_block_start": _on_block_start,
+    "content_block_delta": _on_block_delta,
+    "content_block_stop": _on_block_stop,
+}
+
+#: Buffered token text is flushed once it reaches this many characters...
+TOKEN_BATCH_CHARS = 64
+#: ...or once this many seconds have passed since the previous flush.
+TOKEN_BATCH_SECONDS = 0.05
+
+
+def _coalesce_tokens(
+    events: Iterator[tuple[str, object]],
+) -> Iterator[tuple[str, object]]:
+    """Merge consecutive ``token`` events into larger chunks.
+
+    Claude's text deltas are often only a few characters long; batching them
+    means far fewer yields (and UI re-renders) per response. The flush
+    deadline is checked on every SDK event, not just on text deltas, and
+    pending text is always flushed at the end of a content block and before
+    any other event, so the overall ordering is kept and text is never held
+    back while Claude runs a web search.
+    """
+    buf: list[str] = []
+    size = 0
+    last_flush = time.monotonic()
+    for kind, payload in events:
+        now = time.monotonic()
+        if kind == "token":
+            buf.append(payload)
+            size += len(payload)
+        forward = kind not in ("token", _TICK, _FLUSH)
+        if buf and (
+            forward
+            or kind == _FLUSH
+            or size >= TOKEN_BATCH_CHARS
+            or now - last_flush >= TOKEN_BATCH_SECONDS
+        ):
+            yield ("token", "".join(buf))
+            buf.clear()
+            size = 0
+            last_flush = now
+        if forward:
+            yield (kind, payload)
+    if buf:
+        yield ("token", "".join(buf))
+
+
 def research_streaming(
     topic: str,
     lens: str = "general",
+    collect_raw: bool = True,
 ) -> Generator[tuple[str, object], None, None]:
     """Stream a Claude research session with web search.
 
     Yields ``(event_type, payload)`` tuples:
 
     * ``("token",   str)``           — a text chunk from Claude's response
+      (consecutive deltas are batched, see ``TOKEN_BATCH_CHARS``)
     * ``("source",  SourceRef)``     — a web source discovered during search
-    * ``("raw_text", str)``          — the complete assembled text (last event)
+    * ``("raw_text", str)``          — the complete assembled text (last event,
+      only when *collect_raw* is true)
 
     Args:
         topic: The topic to research.
         lens: Research perspective — "general" | "scientific" | "startup" | "vc".
+        collect_raw: Accumulate tokens and emit the final ``raw_text`` event.
+            Streaming consumers that reassemble tokens themselves can pass
+            ``False`` to skip the server-side buffer.
 
     Raises:
         ValueError: If topic is blank.
@@ -94,102 +260,248 @@ def research_streaming(
     if not topic:
         raise ValueError("Topic must not be empty.")
 
-    system = LENS_SYSTEMS.get(lens, LENS_SYSTEMS["general"])
-    client = anthropic.Anthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
+    system = _LENS_SYSTEM_BLOCKS.get(lens, _LENS_SYSTEM_BLOCKS["general"])
+    client = _client()
+
+    text_buf = io.StringIO() if collect_raw else None
+    yield from _coalesce_tokens(_stream_events(client, topic, system, text_buf))
+
+    if text_buf is not None:
+        yield ("raw_text", text_buf.getvalue())
 
-    sources: list[SourceRef] = []
-    text_parts: list[str] = []
 
-    with client.beta.messages.stream(
+def _stream_events(
+    client: anthropic.Anthropic,
+    topic: str,
+    system: list[dict],
+    text_buf: io.StringIO | None,
+) -> Iterator[tuple[str, object]]:
+    """Run the web-search stream, yielding handler events plus a tick per SDK event."""
+    sources: dict[str, SourceRef] = {}
+    with opened_stream(client.beta.messages.stream(
         model=RESEARCH_MODEL,
         max_tokens=1200,
         betas=[WEB_SEARCH_BETA],
         tools=[WEB_SEARCH_TOOL],
         system=system,
         messages=[{"role": "user", "content": f"Research: {topic}"}],
-    ) as stream:
+    )) as stream:
         for event in stream:
-            event_type = getattr(event, "type", None)
-
-            # ── Capture sources from web_search_result blocks ──────────────
-            if event_type == "content_block_start":
-                block = getattr(event, "content_block", None)
-                if block and getattr(block, "type", None) == "web_search_tool_result":
-                    for result in getattr(block, "content", []) or []:
-                        if getattr(result, "type", None) == "web_search_result" and len(sources) < 5:
-                            src = SourceRef(
-                                title=getattr(result, "title", "") or "",
-                                url=getattr(result, "url", "") or "",
-                                snippet=(getattr(result, "page_age", "") or ""),
-                            )
-                            sources.append(src)
-                            yield ("source", src)
-
-            # ── Stream text tokens ─────────────────────────────────────────
-            elif event_type == "content_block_delta":
-                delta = getattr(event, "delta", None)
-                if delta and getattr(delta, "type", None) == "text_delta":
-                    chunk = delta.text
-                    text_parts.append(chunk)
-                    yield ("token", chunk)
-
-    raw_text = "".join(text_parts)
-    yield ("raw_text", raw_text)
+            # SDK stream events always carry ``.type``; dispatch on it directly
+            handler = _EVENT_HANDLERS.get(event.type)
+            if handler is not None:
+                yield from handler(event, sources, text_buf)
+            yield (_TICK, None)
 
 
 # ── Structuring pass ───────────────────────────────────────────────────────
 
-def structure(
+#: Markdown headings (``## Overview``) or bold-only lines (``**Key Points**``).
+#: Bold lines only count as headings when they name a summary section.
+_HEADING_RE = re.compile(
+    r"^[ \t]*(?:(?P<level>#{1,6})[ \t]+(?P<hash>.+?)[ \t#]*"
+    r"|\*\*(?P<bold>[^*\n]+?):?\*\*:?[ \t]*)$",
+    re.MULTILINE,
+)
+#: Bullet or numbered list item; the group is the item text.
+_BULLET_RE = re.compile(r"^[ \t]*(?:[-*•]|\d+[.)])[ \t]+(.+?)[ \t]*$", re.MULTILINE)
+
+#: Heading keyword → TopicSummary field, checked in order. Covers the section
+#: names each lens prompt asks for ("5 investment highlights", "risks", ...).
+_SECTION_FIELDS: tuple[tuple[re.Pattern[str], str], ...] = (
+    (re.compile(r"gap|caveat|limitation|risk|challenge", re.I), "gaps_and_caveats"),
+    (re.compile(r"trend", re.I), "trends"),
+    (re.compile(r"key|highlight|finding|opportunit", re.I), "key_points"),
+    (re.compile(r"overview|summary|abstract", re.I), "overview"),
+)
+
+#: Inline markdown → replacement, so fast-path fields read like the plain
+#: text the structuring call returns. Links keep their text.
+_INLINE_MARKDOWN: tuple[tuple[re.Pattern[str], str], ...] = (
+    # [text](url) and ![alt](src)
+    (re.compile(r"!?\[([^\]\n]*)\]\([^)\n]*\)"), r"\1"),
+    # **bold** / __bold__
+    (re.compile(r"(\*\*|__)(?=\S)(.+?)(?<=\S)\1"), r"\2"),
+    # *em* / _em_, but not snake_case or "2 * 3"
+    (re.compile(r"(?<![\w*])([*_])(?=\S)([^*_\n]+?)(?<=\S)\1(?!\w)"), r"\2"),
+    # `code`
+    (re.compile(r"`([^`\n]+)`"), r"\1"),
+)
+
+#: Fewest key points the fast path accepts before deferring to Claude.
+MIN_FAST_KEY_POINTS = 3
+
+
+def _strip_inline_markdown(text: str) -> str:
+    """Remove emphasis, inline code and link syntax, keeping the visible text."""
+    for pattern, replacement in _INLINE_MARKDOWN:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def _heading_level(heading: re.Match[str]) -> int:
+    """Return a heading's depth: 1–6 for ``#`` headings, 7 for bold lines."""
+    return len(heading.group("level") or "#######")
+
+
+def _try_regex_structure(
     topic: str,
     raw_text: str,
     sources: list[SourceRef],
     lens: str = "general",
-) -> TopicSummary:
-    """Convert free-form research text into a validated TopicSummary.
+) -> TopicSummary | None:
+    """Build a TopicSummary straight from a well-sectioned research report.
+
+    The lens prompts ask for overview / key points / trends / gaps sections,
+    and Claude usually writes them as markdown headings. When every section
+    is present exactly once (with at least ``MIN_FAST_KEY_POINTS`` bullet
+    points) the summary is assembled locally, skipping the structuring call
+    entirely. Anything ambiguous is left to Claude.
 
-    Makes a fast, non-streaming Claude call asking it to extract structured
-    JSON from the research text.
+    Returns:
+        The summary, or ``None`` if the report is not structured enough.
+    """
+    headings: list[tuple[re.Match[str], str | None]] = []
+    for match in _HEADING_RE.finditer(raw_text):
+        title = match.group("hash") or match.group("bold")
+        field = next((f for pattern, f in _SECTION_FIELDS if pattern.search(title)), None)
+        if match.group("bold") is None or field is not None:
+            headings.append((match, field))  # Other bold lines are body text
+
+    # A first heading shallower than all the rest is the document title
+    # ("# Quantum Computing: State and Trends"), not a section.
+    levels = [_heading_level(match) for match, _ in headings]
+    if len(levels) > 1 and levels[0] < min(levels[1:]):
+        headings = headings[1:]
+
+    sections: dict[str, str] = {}
+    for i, (heading, field) in enumerate(headings):
+        if field is None:
+            continue
+        if field in sections:
+            return None  # Two candidate sections; let Claude pick
+        end = headings[i + 1][0].start() if i + 1 < len(headings) else len(raw_text)
+        body = _strip_inline_markdown(raw_text[heading.end():end]).strip()
+        if body:
+            sections[field] = body
+
+    if len(sections) < len(_SECTION_FIELDS):
+        return None
+    key_points = _BULLET_RE.findall(sections["key_points"])
+    if len(key_points) < MIN_FAST_KEY_POINTS:
+        return None
+
+    return TopicSummary(
+        topic=topic,
+        lens=lens,
+        overview=sections["overview"],
+        key_points=key_points,
+        trends=sections["trends"],
+        gaps_and_caveats=sections["gaps_and_caveats"],
+        sources=sources[:10],
+    )
+
+
+def structure_streaming(
+    topic: str,
+    raw_text: str,
+    sources: list[SourceRef],
+    lens: str = "general",
+) -> Generator[tuple[str, object], None, None]:
+    """Stream the structuring pass, then yield the validated TopicSummary.
+
+    Yields ``(event_type, payload)`` tuples:
+
+    * ``("structure_delta", str)``      — a chunk of the JSON being generated
+    * ``("structured", TopicSummary)``  — the validated summary (last event)
+
+    When *raw_text* already has every summary section as a heading, the
+    summary is extracted locally and only the ``structured`` event is yielded.
 
     Args:
         topic: The original topic string.
         raw_text: The full text from the research_streaming pass.
         sources: Web sources collected during the streaming pass.
-
-    Returns:
-        A validated TopicSummary.
+        lens: Research perspective the summary was produced under.
 
     Raises:
         RuntimeError: If Claude's output cannot be parsed into TopicSummary.
+        anthropic.APIError: On API errors.
     """
-    client = anthropic.Anthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
+    # Fast path: a well-sectioned report needs no second Claude call
+    fast = _try_regex_structure(topic, raw_text, sources, lens)
+    if fast is not None:
+        yield ("structured", fast)
+        return
+
+    client = _client()
 
     # Keep the structuring prompt small to stay within rate limits
-    truncated = raw_text[:2000] if len(raw_text) > 2000 else raw_text
-    source_list = "\n".join(f"- {s.title}: {s.url}" for s in sources[:5])
+    truncated = raw_text[:2000]
+    source_list = "\n".join(map(_format_source, sources[:MAX_SOURCES]))
     user_content = (
         f"Topic: {topic}\n\n"
         f"Sources:\n{source_list or '(none)'}\n\n"
         f"Report:\n{truncated}"
     )
 
-    response = client.messages.parse(
+    json_buf = io.StringIO()
+
+    with opened_stream(client.messages.stream(
         model=STRUCTURE_MODEL,
         max_tokens=700,
-        system=STRUCTURE_SYSTEM,
+        system=_STRUCTURE_SYSTEM_BLOCKS,
         messages=[{"role": "user", "content": user_content}],
-        output_format=TopicSummary,
-    )
+        output_config={"format": _topic_summary_format()},
+    )) as stream:
+        for event in stream:
+            if event.type == "content_block_delta" and event.delta.type == "text_delta":
+                json_buf.write(event.delta.text)
+                yield ("structure_delta", event.delta.text)
+
+    # Patch the raw JSON before validating so the summary is built exactly
+    # once, instead of validating and then copying it with corrections.
+    try:
+        data = json.loads(json_buf.getvalue())
+        if isinstance(data, dict):
+            data["topic"] = topic
+            data["lens"] = lens
+            # Fall back to the streaming-captured sources if Claude gave none
+            if not data.get("sources") and sources:
+                data["sources"] = sources[:10]
+        structured = TopicSummary.model_validate(data)
+    except ValueError as exc:  # JSONDecodeError and ValidationError both subclass it
+        raise RuntimeError(f"Could not parse structured summary for {topic!r}") from exc
+
+    yield ("structured", structured)
 
-    structured = response.parsed_output
 
-    # Merge streaming-captured sources if Claude produced fewer
-    if not structured.sources and sources:
-        structured = structured.model_copy(update={"sources": sources[:10]})
+def structure(
+    topic: str,
+    raw_text: str,
+    sources: list[SourceRef],
+    lens: str = "general",
+) -> TopicSummary:
+    """Convert free-form research text into a validated TopicSummary.
 
-    # Ensure topic and lens are set correctly
-    structured = structured.model_copy(update={"topic": topic, "lens": lens})
+    Blocking wrapper around ``structure_streaming`` for callers that do not
+    need the partial JSON.
 
-    return structured
+    Args:
+        topic: The original topic string.
+        raw_text: The full text from the research_streaming pass.
+        sources: Web sources collected during the streaming pass.
+
+    Returns:
+        A validated TopicSummary.
+
+    Raises:
+        RuntimeError: If Claude's output cannot be parsed into TopicSummary.
+    """
+    for event_type, payload in structure_streaming(topic, raw_text, sources, lens=lens):
+        if event_type == "structured":
+            return payload
+    raise RuntimeError(f"Structuring produced no summary for {topic!r}")
 
 
 # ── Convenience wrapper ────────────────────────────────────────────────────
@@ -216,3 +528,38 @@ def research(topic: str, lens: str = "general") -> TopicSummary:
             raw_text = payload
 
     return structure(topic, raw_text, sources, lens=lens)
+
+
+#: Default cap on concurrent research calls in ``research_many``; keeps a
+#: fan-out within Anthropic's per-minute rate limits.
+MAX_CONCURRENT_RESEARCH = 4
+
+
+def research_many(
+    topics: list[str],
+    lens: str = "general",
+    max_workers: int = MAX_CONCURRENT_RESEARCH,
+) -> list[TopicSummary]:
+    """Research several topics concurrently.
+
+    Each topic runs the full ``research()`` pipeline on a bounded thread pool
+    sharing the module's client, so N topics take roughly the time of the
+    slowest one rather than the sum of all of them.
+
+    Args:
+        topics: Topics to research.
+        lens: Research perspective applied to every topic.
+        max_workers: Maximum number of research calls in flight at once.
+
+    Returns:
+        One TopicSummary per topic, in the same order as *topics*.
+
+    Raises:
+        ValueError: If any topic is blank.
+        anthropic.APIError: On API errors (the first failure is re-raised).
+    """
+    if not topics:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(topics))) as pool:
+        return list(pool.map(partial(research, lens=lens), topics))
@@ -13,18 +13,32 @@ Phase 1 implementation:
 
 from __future__ import annotations
 
+import io
 import logging
 import re
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import cache, lru_cache
 from typing import TYPE_CHECKING, Optional
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
+
+from core.cache import TTLCache
+from core.client import cached_system, get_client, opened_stream
+
+try:
+    import ahocorasick  # Optional: pyahocorasick speeds up intent signal matching
+except ImportError:
+    ahocorasick = None
 
 if TYPE_CHECKING:
     from config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+#: Bound for the per-string memo caches below — ample for a user session.
+_MEMO_SIZE = 512
+
 # ── Enums ──────────────────────────────────────────────────────────────────────
 
 
@@ -40,7 +54,7 @@ class Intent(str, Enum):
 # ── Data classes ───────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """A single search result from any content source."""
 
@@ -53,8 +67,20 @@ class SearchResult:
     relevance_explanation: str = ""     # Filled in by summarizer.py
     ai_summary: str = ""               # Filled in by summarizer.py
 
+    def to_api_dict(self) -> dict[str, Optional[str]]:
+        """Return the JSON shape used for a result in ``/api/search`` sections."""
+        return {
+            "title": self.title,
+            "url": self.url,
+            "snippet": self.snippet,
+            "ai_summary": self.ai_summary or self.snippet,
+            "source": self.source,
+            "published_date": self.published_date,
+            "relevance_explanation": self.relevance_explanation,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class SearchResponse:
     """Complete response from a full search operation."""
 
@@ -63,6 +89,8 @@ class SearchResponse:
     time_range: Optional[str]
     results: list[SearchResult] = field(default_factory=list)
     raw_text: str = ""
+    #: True when served from the orchestrator's response cache.
+    cached: bool = False
 
 
 # ── Intent detection ───────────────────────────────────────────────────────────
@@ -84,7 +112,51 @@ _BUSINESS_SIGNALS: frozenset[str] = frozenset([
     "investor", "unicorn", "mrr", "arr", "churn", "b2b", "saas",
 ])
 
+#: Signal sets per intent, in tie-break order for ``detect_intent``.
+_INTENT_SIGNALS: dict[Intent, frozenset[str]] = {
+    Intent.ACADEMIC: _ACADEMIC_SIGNALS,
+    Intent.TUTORIAL: _TUTORIAL_SIGNALS,
+    Intent.BUSINESS: _BUSINESS_SIGNALS,
+}
 
+
+@cache
+def _signal_automaton() -> object:
+    """Return one Aho-Corasick automaton over every intent signal, built on first use.
+
+    Returns ``None`` when ``pyahocorasick`` is not installed, in which case
+    ``_count_signals`` falls back to per-signal substring checks.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for intent, signals in _INTENT_SIGNALS.items():
+        for signal in signals:
+            automaton.add_word(signal, (intent, signal))
+    automaton.make_automaton()
+    return automaton
+
+
+def _count_signals(query_lower: str) -> dict[Intent, int]:
+    """Count the distinct signals of each intent that occur in *query_lower*.
+
+    With the automaton this is a single pass over the query; otherwise each
+    signal is checked with a substring test. Both count a signal once no
+    matter how often it occurs, and overlapping signals ("paper" inside
+    "papers") each count.
+    """
+    counts = dict.fromkeys(_INTENT_SIGNALS, 0)
+    automaton = _signal_automaton()
+    if automaton is not None:
+        for intent, _signal in {value for _end, value in automaton.iter(query_lower)}:
+            counts[intent] += 1
+    else:
+        for intent, signals in _INTENT_SIGNALS.items():
+            counts[intent] = sum(1 for sig in signals if sig in query_lower)
+    return counts
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
 def detect_intent(query: str) -> Intent:
     """Detect the user's likely intent from their natural language query.
 
@@ -105,39 +177,38 @@ def detect_intent(query: str) -> Intent:
         >>> detect_intent("OpenAI funding round Series C 2024")
         <Intent.BUSINESS: 'business'>
     """
-    query_lower = query.lower()
-
-    # Count signal hits per intent category
-    academic_hits = sum(1 for sig in _ACADEMIC_SIGNALS if sig in query_lower)
-    tutorial_hits = sum(1 for sig in _TUTORIAL_SIGNALS if sig in query_lower)
-    business_hits = sum(1 for sig in _BUSINESS_SIGNALS if sig in query_lower)
-
-    if not any([academic_hits, tutorial_hits, business_hits]):
-        return Intent.EXPLORATORY
-
-    # Return the category with the most signal hits
-    scores = {
-        Intent.ACADEMIC: academic_hits,
-        Intent.TUTORIAL: tutorial_hits,
-        Intent.BUSINESS: business_hits,
-    }
-    return max(scores, key=lambda k: scores[k])
+    # One pass picks the category with the most signal hits; the strict ``>``
+    # keeps ties on the first in order and leaves EXPLORATORY when none hit.
+    best, best_hits = Intent.EXPLORATORY, 0
+    for intent, hits in _count_signals(query.lower()).items():
+        if hits > best_hits:
+            best, best_hits = intent, hits
+    return best
 
 
 # ── Time-range parsing ─────────────────────────────────────────────────────────
 
-#: Regex patterns for extracting time range hints from a query.
-_TIME_RANGE_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"past \d+ (?:months?|years?|weeks?|days?)", re.IGNORECASE),
-    re.compile(r"last \d+ (?:months?|years?|weeks?|days?)", re.IGNORECASE),
-    re.compile(r"(?:this|last) (?:year|month|week)", re.IGNORECASE),
-    re.compile(r"\b20\d{2}\b"),   # Four-digit year e.g. 2024
-]
+@cache
+def _time_range_re() -> re.Pattern[str]:
+    """Return the time-range regex, compiled on first use to keep imports cheap.
 
+    A single alternation over every time-range hint, so one scan finds the
+    earliest hint in the query.
+    """
+    return re.compile(
+        r"(?:past|last) \d+ (?:months?|years?|weeks?|days?)"
+        r"|(?:this|last) (?:year|month|week)"
+        r"|\b20\d{2}\b",   # Four-digit year e.g. 2024
+        re.IGNORECASE,
+    )
 
+
+@lru_cache(maxsize=_MEMO_SIZE)
 def parse_time_range(query: str) -> Optional[str]:
     """Extract an optional time-range hint from a natural language query.
 
+    When a query contains several hints, the earliest one is returned.
+
     Args:
         query: The raw search query string.
 
@@ -152,11 +223,8 @@ def parse_time_range(query: str) -> Optional[str]:
         >>> parse_time_range("quantum computing basics")
         None
     """
-    for pattern in _TIME_RANGE_PATTERNS:
-        match = pattern.search(query)
-        if match:
-            return match.group(0)
-    return None
+    match = _time_range_re().search(query)
+    return match.group(0) if match else None
 
 
 # ── Search orchestrator ────────────────────────────────────────────────────────
@@ -169,17 +237,73 @@ _WEB_SEARCH_TOOL = {
     "name": "web_search",
 }
 
-_WWW_PREFIX = re.compile(r"^www\.")
+#: Signature shared by the stream event handlers below.
+_StreamHandler = Callable[[object, dict[str, SearchResult], io.StringIO], None]
 
 
+@lru_cache(maxsize=_MEMO_SIZE)
 def _hostname(url: str) -> str:
-    """Return the bare hostname of *url*, stripping any ``www.`` prefix."""
+    """Return the bare hostname of *url*, stripping any ``www.`` prefix.
+
+    ``urlsplit`` skips the ``;params`` parsing that ``urlparse`` does; it only
+    raises ``ValueError``, for malformed IPv6 hosts such as ``http://[::1``.
+    """
     try:
-        return _WWW_PREFIX.sub("", urlparse(url).netloc) or url
-    except Exception:
+        return urlsplit(url).netloc.removeprefix("www.") or url
+    except ValueError:
         return url
 
 
+def _on_block_start(
+    event: object,
+    results: dict[str, SearchResult],
+    text_buf: io.StringIO,  # noqa: ARG001  (uniform handler signature)
+) -> None:
+    """Capture new sources from a ``web_search_tool_result`` block.
+
+    *results* is keyed by URL so pages returned by several searches are kept
+    once, leaving room under ``max_search_results`` for distinct sources.
+    """
+    block = event.content_block
+    if block.type != "web_search_tool_result" or not isinstance(block.content, list):
+        return  # Other block types, or a search error payload
+    for item in block.content:
+        if item.type != "web_search_result":
+            continue
+        url = item.url or ""
+        if url and url not in results:
+            results[url] = SearchResult(
+                title=item.title or "",
+                url=url,
+                snippet="",
+                source=_hostname(url),
+                published_date=item.page_age or None,
+            )
+
+
+def _on_block_delta(
+    event: object,
+    results: dict[str, SearchResult],  # noqa: ARG001  (uniform handler signature)
+    text_buf: io.StringIO,
+) -> None:
+    """Collect Claude's text response from a ``text_delta``."""
+    delta = event.delta
+    if delta.type == "text_delta":
+        text_buf.write(delta.text)
+
+
+#: Stream event type → handler. Events with no entry are ignored.
+_STREAM_HANDLERS: dict[str, _StreamHandler] = {
+    "content_block_start": _on_block_start,
+    "content_block_delta": _on_block_delta,
+}
+
+
+def _detached(response: SearchResponse, **changes: object) -> SearchResponse:
+    """Return a copy of *response* that shares no ``SearchResult`` objects with it."""
+    return replace(response, results=[replace(r) for r in response.results], **changes)
+
+
 class SearchOrchestrator:
     """Orchestrates web searches using the Claude ``web_search`` tool.
 
@@ -222,6 +346,12 @@ class SearchOrchestrator:
         ),
     }
 
+    #: System prompts as text blocks marked for prompt caching, built once so
+    #: repeat searches for an intent reuse the cached prompt prefix.
+    _SYSTEM_BLOCKS: dict[str, list[dict]] = {
+        intent: cached_system(text) for intent, text in _SYSTEM_PROMPTS.items()
+    }
+
     def __init__(self, settings: Settings) -> None:
         """Initialise the orchestrator.
 
@@ -229,24 +359,26 @@ class SearchOrchestrator:
             settings: Application configuration (must have ``anthropic_api_key``).
         """
         self.settings = settings
-        self._client: object = None  # Lazy-initialised anthropic.Anthropic instance
+        self._client: object = None  # Resolved lazily from core.client
+        self._tool = {**_WEB_SEARCH_TOOL, "max_uses": settings.max_web_searches}
+        self._cache: TTLCache[SearchResponse] = TTLCache(
+            maxsize=settings.search_cache_size, ttl=settings.search_cache_ttl,
+        )
 
     @property
     def client(self) -> object:
-        """Lazy-initialise and return the Anthropic SDK client."""
+        """Return the Anthropic client shared by every caller using this API key."""
         if self._client is None:
-            import anthropic
-            self._client = anthropic.Anthropic(
-                api_key=self.settings.anthropic_api_key,
-                max_retries=5,
-            )
+            self._client = get_client(self.settings.anthropic_api_key)
         return self._client
 
     def search(self, query: str, time_range: Optional[str] = None) -> SearchResponse:
         """Perform a full search for the given query.
 
         Detects intent, selects the appropriate system prompt, calls the Claude
-        web_search API, and returns a structured ``SearchResponse``.
+        web_search API, and returns a structured ``SearchResponse``. Repeat
+        queries (case-insensitive, same time range) are answered from an
+        in-memory TTL cache with ``cached=True``.
 
         Args:
             query: Natural language search query.
@@ -267,7 +399,13 @@ class SearchOrchestrator:
 
         intent = detect_intent(query)
         detected_time_range = time_range or parse_time_range(query)
-        system = self._SYSTEM_PROMPTS[intent]
+        cache_key = (query.lower(), intent, detected_time_range)
+        hit = self._cache.get(cache_key)
+        if hit is not None:
+            logger.info("Search cache hit query=%r", query)
+            return _detached(hit, query=query, cached=True)
+
+        system = self._SYSTEM_BLOCKS[intent]
 
         # Append time constraint to the user message if present
         user_message = f"Research: {query}"
@@ -279,47 +417,34 @@ class SearchOrchestrator:
             query, intent.value, detected_time_range,
         )
 
-        results: list[SearchResult] = []
-        text_parts: list[str] = []
-        tool = {**_WEB_SEARCH_TOOL, "max_uses": self.settings.max_web_searches}
+        results: dict[str, SearchResult] = {}  # URL → result, in arrival order
+        text_buf = io.StringIO()
 
-        with self.client.beta.messages.stream(
+        with opened_stream(self.client.beta.messages.stream(
             model=self.settings.research_model,
             max_tokens=800,
             betas=[_WEB_SEARCH_BETA],
-            tools=[tool],
+            tools=[self._tool],
             system=system,
             messages=[{"role": "user", "content": user_message}],
-        ) as stream:
+        )) as stream:
             for event in stream:
-                event_type = getattr(event, "type", None)
-
-                # ── Capture sources from web_search_result blocks ──────────
-                if event_type == "content_block_start":
-                    block = getattr(event, "content_block", None)
-                    if block and getattr(block, "type", None) == "web_search_tool_result":
-                        for item in getattr(block, "content", []) or []:
-                            if getattr(item, "type", None) == "web_search_result":
-                                url = getattr(item, "url", "") or ""
-                                results.append(SearchResult(
-                                    title=getattr(item, "title", "") or "",
-                                    url=url,
-                                    snippet="",
-                                    source=_hostname(url),
-                                    published_date=getattr(item, "page_age", None) or None,
-                                ))
-
-                # ── Collect Claude's text response ─────────────────────────
-                elif event_type == "content_block_delta":
-                    delta = getattr(event, "delta", None)
-                    if delta and getattr(delta, "type", None) == "text_delta":
-                        text_parts.append(delta.text)
+                # SDK stream events always carry ``.type``; dispatch on it directly
+                handler = _STREAM_HANDLERS.get(event.type)
+                if handler is not None:
+                    handler(event, results, text_buf)
 
         logger.info("Search complete: %d sources found", len(results))
-        return SearchResponse(
+        response = SearchResponse(
             query=query,
             intent=intent,
             time_range=detected_time_range,
-            results=results[:self.settings.max_search_results],
-            raw_text="".join(text_parts),
+            results=list(results.values())[:self.settings.max_search_results],
+            # Stripped once here; the summariser's own .strip() is then a no-op
+            raw_text=text_buf.getvalue().strip(),
         )
+        # Callers annotate results in place (e.g. content_type), so the cache
+        # keeps its own copy; empty result sets are retried, not cached.
+        if response.results:
+            self._cache.set(cache_key, _detached(response))
+        return response
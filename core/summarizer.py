@@ -9,28 +9,39 @@ Provides two levels of summarisation:
    A 2–3 paragraph synthesis across all results with key themes, notable
    trends, and top entities (people, companies, concepts).
 
-The Anthropic client is lazy-initialised so that the class can be
-instantiated in tests without requiring a live API key.
+The Anthropic client is resolved lazily from ``core.client`` so that the
+class can be instantiated in tests without requiring a live API key.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Optional
 
+from core.cache import TTLCache
+from core.client import cached_system, get_client, get_limiter
+
+try:
+    import orjson  # Optional: faster parsing of Claude's JSON responses
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from config.settings import Settings
     from core.search import Intent, SearchResult
 
 logger = logging.getLogger(__name__)
 
+#: JSON decoder for structured responses — orjson when installed, else stdlib.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 # ── Result types ───────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutiveSummary:
     """AI-generated executive summary of a complete search result set."""
 
@@ -47,6 +58,16 @@ class ExecutiveSummary:
     """Notable people, companies, or concepts frequently mentioned."""
 
 
+def _copy_summary(summary: ExecutiveSummary) -> ExecutiveSummary:
+    """Return a copy of *summary* that shares none of its lists with it."""
+    return replace(
+        summary,
+        key_themes=list(summary.key_themes),
+        notable_trends=list(summary.notable_trends),
+        top_entities=list(summary.top_entities),
+    )
+
+
 # ── Summariser ─────────────────────────────────────────────────────────────────
 
 #: System prompt for the executive summary call.
@@ -55,6 +76,9 @@ _EXEC_SUMMARY_SYSTEM = (
     "structured JSON summary. Return only valid JSON, no commentary, no markdown fences."
 )
 
+#: System prompt as a text block marked for prompt caching.
+_EXEC_SUMMARY_SYSTEM_BLOCKS: list[dict] = cached_system(_EXEC_SUMMARY_SYSTEM)
+
 #: Pydantic-compatible JSON schema used for structured output.
 _EXEC_SUMMARY_SCHEMA: dict = {
     "type": "object",
@@ -98,19 +122,17 @@ class Summarizer:
             settings: Application configuration.
         """
         self.settings = settings
-        self._client: object = None  # Lazy-initialised anthropic.Anthropic
+        self._client: object = None  # Resolved lazily from core.client
+        #: Executive summaries keyed by the exact prompt that produced them.
+        self._cache: TTLCache[ExecutiveSummary] = TTLCache(
+            maxsize=settings.search_cache_size, ttl=settings.search_cache_ttl,
+        )
 
     @property
     def client(self) -> object:
-        """Lazy-initialise and return the Anthropic SDK client."""
+        """Return the Anthropic client shared by every caller using this API key."""
         if self._client is None:
-            import anthropic
-            # max_retries=5 so the SDK backs off and retries on 429 rate-limit
-            # errors that occur after the heavier search call.
-            self._client = anthropic.Anthropic(
-                api_key=self.settings.anthropic_api_key,
-                max_retries=5,
-            )
+            self._client = get_client(self.settings.anthropic_api_key)
         return self._client
 
     # ── Card-level summary ─────────────────────────────────────────────────
@@ -151,7 +173,8 @@ class Summarizer:
         """Generate an executive summary across all search results.
 
         Uses structured output (JSON schema) to produce a validated
-        ``ExecutiveSummary`` object.
+        ``ExecutiveSummary`` object. Successful summaries are cached by
+        prompt, so repeat searches with the same results skip the API call.
 
         Args:
             query: The original search query.
@@ -174,12 +197,13 @@ class Summarizer:
         # If Claude's research report is available, use it directly as the
         # overview — this avoids a second API call and the associated rate-limit
         # risk.  A follow-up structured call is only made when raw_text is absent.
-        if raw_text and raw_text.strip():
-            return ExecutiveSummary(overview=raw_text.strip())
+        overview = raw_text.strip() if raw_text else ""
+        if overview:
+            return ExecutiveSummary(overview=overview)
 
         # Fallback: build a compact title list and ask Claude to summarise.
         context = "\n".join(
-            f"[{i + 1}] {r.title}" for i, r in enumerate(results[:10])
+            f"[{i}] {r.title}" for i, r in enumerate(results[:10], start=1)
         )
         intent_instruction = {
             "academic": "Focus on methodology, evidence quality, and research gaps.",
@@ -194,18 +218,24 @@ class Summarizer:
             f"Sources:\n{context}"
         )
 
+        # The prompt fully determines the summary, so repeats skip the call
+        cached = self._cache.get(user_content)
+        if cached is not None:
+            return _copy_summary(cached)
+
         try:
-            response = self.client.messages.create(
-                model=self.settings.summary_model,
-                max_tokens=500,
-                system=_EXEC_SUMMARY_SYSTEM,
-                messages=[{"role": "user", "content": user_content}],
-                output_config={
-                    "format": {"type": "json_schema", "schema": _EXEC_SUMMARY_SCHEMA}
-                },
-            )
-            data = json.loads(response.content[0].text)
-            return ExecutiveSummary(
+            with get_limiter().slot():
+                response = self.client.messages.create(
+                    model=self.settings.summary_model,
+                    max_tokens=500,
+                    system=_EXEC_SUMMARY_SYSTEM_BLOCKS,
+                    messages=[{"role": "user", "content": user_content}],
+                    output_config={
+                        "format": {"type": "json_schema", "schema": _EXEC_SUMMARY_SCHEMA}
+                    },
+                )
+            data = _json_loads(response.content[0].text)
+            summary = ExecutiveSummary(
                 overview=data.get("overview", ""),
                 key_themes=data.get("key_themes", []),
                 notable_trends=data.get("notable_trends", []),
@@ -216,3 +246,8 @@ class Summarizer:
             return ExecutiveSummary(
                 overview=f"Found {len(results)} results for '{query}'.",
             )
+
+        # Failures above are not cached. The cache keeps its own copy, since
+        # callers may edit the list fields of the summary they get back.
+        self._cache.set(user_content, _copy_summary(summary))
+        return summary
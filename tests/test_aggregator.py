@@ -0,0 +1,88 @@
+"""Tests for core/aggregator.py — deduplication, grouping, and prioritisation."""
+
+from __future__ import annotations
+
+import pytest
+
+from core.aggregator import aggregate, deduplicate, group_by_type, prioritize_sections
+from core.search import SearchResult
+
+
+def make_result(url: str, content_type: str = "news") -> SearchResult:
+    return SearchResult(
+        title=url,
+        url=url,
+        snippet="",
+        source="example.com",
+        content_type=content_type,
+    )
+
+
+# ── Deduplication ──────────────────────────────────────────────────────────────
+
+
+class TestDeduplicate:
+    def test_removes_exact_duplicates(self):
+        a, b = make_result("https://a.com/x"), make_result("https://b.com/y")
+        assert deduplicate([a, b, a]) == [a, b]
+
+    def test_trailing_slash_and_case_normalised(self):
+        a = make_result("https://Example.com/")
+        b = make_result("https://example.com")
+        assert deduplicate([a, b]) == [a]
+
+    def test_empty_url_dropped(self):
+        assert deduplicate([make_result("")]) == []
+
+    def test_preserves_first_occurrence_order(self):
+        results = [make_result(f"https://site.com/{i}") for i in range(5)]
+        assert deduplicate(results + results[::-1]) == results
+
+
+# ── Full pipeline ──────────────────────────────────────────────────────────────
+
+
+class TestAggregate:
+    def test_matches_unfused_pipeline(self):
+        results = [
+            make_result("https://arxiv.org/1", "papers"),
+            make_result("https://news.com/1", "news"),
+            make_result("https://arxiv.org/1/", "papers"),
+            make_result("https://reddit.com/1", "discussions"),
+            make_result("https://arxiv.org/2", "papers"),
+        ]
+        expected = prioritize_sections(
+            group_by_type(deduplicate(results)[:3]), "academic"
+        )
+        assert aggregate(results, "academic", max_results=3) == expected
+
+    def test_max_results_counts_unique_results_only(self):
+        a, b = make_result("https://a.com"), make_result("https://b.com")
+        sections = aggregate([a, a, a, b], "exploratory", max_results=2)
+        assert sections == [("news", [a, b])]
+
+    def test_empty_input(self):
+        assert aggregate([], "academic") == []
+
+
+# ── Prioritisation ─────────────────────────────────────────────────────────────
+
+
+class TestPrioritizeSections:
+    def test_academic_puts_papers_first(self):
+        grouped = {"news": [1], "papers": [2], "discussions": [3]}
+        order = [t for t, _ in prioritize_sections(grouped, "academic")]
+        assert order == ["papers", "news", "discussions"]
+
+    def test_unknown_intent_uses_exploratory_order(self):
+        grouped = {"discussions": [1], "papers": [2], "news": [3]}
+        order = [t for t, _ in prioritize_sections(grouped, "nonsense")]
+        assert order == ["news", "papers", "discussions"]
+
+    def test_empty_sections_omitted(self):
+        assert prioritize_sections({"papers": [], "news": [1]}, "academic") == [("news", [1])]
+
+    def test_unranked_types_appended_in_original_order(self):
+        grouped = {"unknown": [1], "zeta": [2], "news": [3]}
+        order = [t for t, _ in prioritize_sections(grouped, "business")]
+        assert order == ["news", "unknown", "zeta"]
@@ -0,0 +1,40 @@
+"""Tests for core/cache.py — TTL + LRU cache."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from core.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_miss_returns_none(self):
+        assert TTLCache(maxsize=2, ttl=60).get("missing") is None
+
+    def test_set_then_get(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+    def test_entries_expire(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        with patch("core.cache.time.monotonic", return_value=0.0):
+            cache.set("a", 1)
+        with patch("core.cache.time.monotonic", return_value=61.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_evicted(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")          # "b" is now the least recently used
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_zero_maxsize_disables(self):
+        cache = TTLCache(maxsize=0, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") is None
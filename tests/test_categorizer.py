@@ -4,45 +4,57 @@ from __future__ import annotations
 
 import pytest
 
-from core.categorizer import ContentType, classify_url, classify_by_text
+import core.categorizer as categorizer
+from core.categorizer import ContentType, classify_by_text, classify_result, classify_url
+from core.search import SearchResult
 
 
 # ── URL classification ─────────────────────────────────────────────────────────
 
 
-class TestClassifyUrl:
-    def test_arxiv_is_paper(self):
-        assert classify_url("https://arxiv.org/abs/2401.12345") == ContentType.PAPERS
-
-    def test_pubmed_is_paper(self):
-        assert classify_url("https://pubmed.ncbi.nlm.nih.gov/12345678/") == ContentType.PAPERS
-
-    def test_reddit_is_discussion(self):
-        assert classify_url("https://reddit.com/r/MachineLearning/comments/xyz") == ContentType.DISCUSSIONS
-
-    def test_hackernews_is_discussion(self):
-        assert classify_url("https://news.ycombinator.com/item?id=12345") == ContentType.DISCUSSIONS
-
-    def test_github_is_code(self):
-        assert classify_url("https://github.com/anthropics/anthropic-sdk-python") == ContentType.CODE
-
-    def test_youtube_is_video(self):
-        assert classify_url("https://youtube.com/watch?v=abc123") == ContentType.VIDEOS
-
-    def test_youtu_be_is_video(self):
-        assert classify_url("https://youtu.be/abc123") == ContentType.VIDEOS
-
-    def test_techcrunch_is_news(self):
-        assert classify_url("https://techcrunch.com/2024/01/01/story") == ContentType.NEWS
-
-    def test_www_prefix_stripped(self):
-        assert classify_url("https://www.arxiv.org/abs/2401.12345") == ContentType.PAPERS
-
-    def test_invalid_url_returns_unknown(self):
-        assert classify_url("not-a-url") == ContentType.UNKNOWN
-
-    def test_empty_url_returns_unknown(self):
-        assert classify_url("") == ContentType.UNKNOWN
+URL_CASES = [
+    pytest.param("https://arxiv.org/abs/2401.12345", ContentType.PAPERS, id="arxiv"),
+    pytest.param("https://pubmed.ncbi.nlm.nih.gov/12345678/", ContentType.PAPERS, id="pubmed"),
+    pytest.param("https://reddit.com/r/MachineLearning/comments/xyz", ContentType.DISCUSSIONS,
+                 id="reddit"),
+    pytest.param("https://news.ycombinator.com/item?id=12345", ContentType.DISCUSSIONS,
+                 id="hackernews"),
+    pytest.param("https://github.com/anthropics/anthropic-sdk-python", ContentType.CODE,
+                 id="github"),
+    pytest.param("https://youtube.com/watch?v=abc123", ContentType.VIDEOS, id="youtube"),
+    pytest.param("https://youtu.be/abc123", ContentType.VIDEOS, id="youtu.be"),
+    pytest.param("https://techcrunch.com/2024/01/01/story", ContentType.NEWS, id="techcrunch"),
+    pytest.param("https://www.arxiv.org/abs/2401.12345", ContentType.PAPERS, id="www-stripped"),
+    # Subdomains of a listed site family match the family
+    pytest.param("https://old.reddit.com/r/python", ContentType.DISCUSSIONS, id="subdomain"),
+    pytest.param("https://cs.stackexchange.com/q/1", ContentType.DISCUSSIONS,
+                 id="stackexchange-site"),
+    pytest.param("https://news.bbc.co.uk/1/hi/technology", ContentType.NEWS, id="bbc-family"),
+    # ...but umbrella domains pass nothing on to unrelated subdomains
+    pytest.param("https://spectrum.ieee.org/ai-chips", ContentType.NEWS, id="ieee-spectrum"),
+    pytest.param("https://cacm.acm.org/news/x", ContentType.NEWS, id="acm-cacm"),
+    pytest.param("https://discuss.huggingface.co/t/1", ContentType.DISCUSSIONS,
+                 id="huggingface-forum"),
+    pytest.param("https://blog.example.ieee.org/post", ContentType.NEWS, id="ieee-unlisted"),
+    pytest.param("https://ieeexplore.ieee.org/document/1", ContentType.PAPERS,
+                 id="exact-listing-wins"),
+    # ...but only on a label boundary: "notreddit.com" is not "reddit.com"
+    pytest.param("https://notreddit.com/r/python", ContentType.NEWS, id="label-boundary"),
+    pytest.param("https://arxiv.org?abs=1", ContentType.PAPERS, id="host-ends-at-query"),
+    pytest.param("https://GitHub.com#readme", ContentType.CODE, id="host-ends-at-fragment"),
+    pytest.param("http://[::1", ContentType.UNKNOWN, id="malformed-ipv6"),
+    pytest.param("not-a-url", ContentType.UNKNOWN, id="invalid"),
+    pytest.param("", ContentType.UNKNOWN, id="empty"),
+]
+
+
+@pytest.mark.parametrize(("url", "expected"), URL_CASES)
+def test_classify_url(url, expected):
+    assert classify_url(url) == expected
+
+
+def test_site_families_are_listed_domains():
+    assert categorizer._SITE_FAMILIES <= categorizer._DOMAIN_TO_TYPE.keys()
 
 
 # ── Text-based classification ──────────────────────────────────────────────────
@@ -63,3 +75,61 @@ class TestClassifyByText:
 
     def test_generic_defaults_to_news(self):
         assert classify_by_text("Tech article headline", "some article content") == ContentType.NEWS
+
+    def test_title_keyword_takes_precedence_over_snippet(self):
+        assert classify_by_text("Conference talk recording", "arxiv preprint") == ContentType.VIDEOS
+
+
+# ── Combined classification ────────────────────────────────────────────────────
+
+
+def make_result(url: str, title: str = "", snippet: str = "") -> SearchResult:
+    return SearchResult(title=title, url=url, snippet=snippet, source="")
+
+
+class TestClassifyResult:
+    def test_domain_match_wins_over_text(self):
+        result = make_result("https://arxiv.org/abs/1", title="YouTube talk")
+        assert classify_result(result) == ContentType.PAPERS
+
+    def test_unknown_domain_falls_back_to_text(self):
+        result = make_result("https://blog.example.com/post", title="Recorded lecture video")
+        assert classify_result(result) == ContentType.VIDEOS
+
+    def test_umbrella_subdomain_falls_back_to_text(self):
+        result = make_result("https://events.ieee.org/x", title="Recorded lecture video")
+        assert classify_result(result) == ContentType.VIDEOS
+
+    def test_news_subdomain_skips_text_heuristics(self):
+        result = make_result("https://edition.cnn.com/2024/x", title="Watch the video")
+        assert classify_result(result) == ContentType.NEWS
+
+    def test_confirmed_news_domain_skips_text_heuristics(self):
+        result = make_result("https://www.techcrunch.com/2024/x", title="Watch the keynote video")
+        assert classify_result(result) == ContentType.NEWS
+
+
+# ── Keyword matching backends ──────────────────────────────────────────────────
+
+
+KEYWORD_TEXTS = [
+    "openai announces new model for enterprise customers",
+    "a peer-reviewed study on talking robots",
+    "doing the watch party: repository of amazing talks",
+    "see r/python and the github repo",
+    "conference paper posted on reddit",
+    "",
+]
+
+
+class TestFirstCategory:
+    @pytest.mark.parametrize("text", KEYWORD_TEXTS)
+    def test_automaton_matches_regex_fallback(self, text, monkeypatch):
+        if categorizer._keyword_automaton() is None:
+            pytest.skip("pyahocorasick not installed")
+        with_automaton = categorizer._first_category(text)
+        monkeypatch.setattr(categorizer, "_keyword_automaton", lambda: None)
+        assert categorizer._first_category(text) == with_automaton
+
+    def test_keywords_need_word_boundaries(self):
+        assert categorizer._first_category("doing amazing talking") is None
@@ -0,0 +1,122 @@
+"""Tests for core/client.py — shared Anthropic client."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.client import MAX_RETRIES, RateLimiter, cached_system, get_client, get_limiter
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    get_client.cache_clear()
+    yield
+    get_client.cache_clear()
+
+
+@patch("anthropic.Anthropic")
+def test_same_key_reuses_client(mock_cls):
+    assert get_client("key-a") is get_client("key-a")
+    mock_cls.assert_called_once_with(api_key="key-a", max_retries=MAX_RETRIES)
+
+
+@patch("anthropic.Anthropic", side_effect=lambda **_: MagicMock())
+def test_distinct_keys_get_distinct_clients(mock_cls):
+    assert get_client("key-a") is not get_client("key-b")
+    assert mock_cls.call_count == 2
+
+
+@patch("anthropic.Anthropic")
+def test_search_and_summarizer_share_client(mock_cls):
+    from core.search import SearchOrchestrator
+    from core.summarizer import Summarizer
+
+    settings = MagicMock(anthropic_api_key="key-a", max_web_searches=3,
+                         search_cache_size=0, search_cache_ttl=0)
+
+    assert SearchOrchestrator(settings).client is Summarizer(settings).client
+    mock_cls.assert_called_once()
+
+
+def test_cached_system_marks_prompt_for_caching():
+    assert cached_system("Be brief.") == [
+        {"type": "text", "text": "Be brief.", "cache_control": {"type": "ephemeral"}},
+    ]
+
+
+# ── Rate limiting ──────────────────────────────────────────────────────────────
+
+
+class TestRateLimiter:
+    def test_unlimited_rate_never_sleeps(self):
+        limiter = RateLimiter(max_concurrent=2)
+        with patch("core.client.time.sleep") as sleep:
+            for _ in range(10):
+                with limiter.slot():
+                    pass
+        sleep.assert_not_called()
+
+    def test_concurrency_is_capped(self):
+        limiter = RateLimiter(max_concurrent=1)
+        with limiter.slot():
+            assert not limiter._slots.acquire(blocking=False)
+
+    def test_waits_for_token_once_burst_is_spent(self):
+        clock = [0.0]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        with patch("core.client.time.monotonic", side_effect=lambda: clock[0]), \
+             patch("core.client.time.sleep", side_effect=fake_sleep):
+            limiter = RateLimiter(max_concurrent=2, requests_per_minute=60)
+            for _ in range(3):
+                with limiter.slot():
+                    pass
+
+        assert clock[0] == pytest.approx(1.0)  # Third call waits one token (1 s)
+
+    def test_waiting_for_a_slot_times_out(self):
+        limiter = RateLimiter(max_concurrent=1, timeout=0.01)
+        with limiter.slot():
+            with pytest.raises(TimeoutError, match="slot"):
+                with limiter.slot():
+                    pass
+
+    def test_rate_wait_past_timeout_raises_and_frees_slot(self):
+        with patch("core.client.time.monotonic", return_value=0.0):
+            limiter = RateLimiter(max_concurrent=1, requests_per_minute=1, timeout=5)
+            with limiter.slot():
+                pass
+            with pytest.raises(TimeoutError, match="rate limit"):
+                with limiter.slot():
+                    pass
+
+        assert limiter._slots.acquire(blocking=False)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"max_concurrent": 0},
+        {"max_concurrent": 1, "requests_per_minute": -1},
+    ])
+    def test_invalid_limits_raise(self, kwargs):
+        with pytest.raises(ValueError):
+            RateLimiter(**kwargs)
+
+
+def test_limiter_built_from_settings(monkeypatch):
+    from config.settings import get_settings
+
+    monkeypatch.setenv("ANTHROPIC_MAX_CONCURRENCY", "2")
+    monkeypatch.setenv("ANTHROPIC_SLOT_TIMEOUT", "1.5")
+    get_settings.cache_clear()
+    get_limiter.cache_clear()
+    try:
+        limiter = get_limiter()
+        assert limiter is get_limiter()
+        assert limiter._max_concurrent == 2
+        assert limiter.timeout == 1.5
+    finally:
+        get_settings.cache_clear()
+        get_limiter.cache_clear()
@@ -7,7 +7,9 @@ Run with: pytest tests/test_history.py
 """
 
 import os
+import sqlite3
 import tempfile
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
@@ -23,6 +25,7 @@ def temp_db(tmp_path, monkeypatch):
     monkeypatch.setenv("DB_PATH", str(db_file))
     hist.init_db()
     yield
+    hist._reset_connection()
 
 
 @pytest.fixture
@@ -72,6 +75,37 @@ class TestSaveAndRetrieve:
         assert len(entries) == 3
 
 
+class TestSaveMany:
+    def test_inserts_all_rows(self, sample_summary):
+        items = [
+            (f"topic {i}", sample_summary.model_copy(update={"topic": f"topic {i}"}))
+            for i in range(3)
+        ]
+        assert hist.save_many(items) == 3
+        assert [e.topic for e in hist.get_all()] == ["topic 2", "topic 1", "topic 0"]
+
+    def test_empty_batch(self):
+        assert hist.save_many([]) == 0
+        assert hist.get_all() == []
+
+
+class TestListMeta:
+    def test_returns_newest_first_without_summary(self, sample_summary):
+        id1 = hist.save("topic A", sample_summary)
+        id2 = hist.save("topic B", sample_summary)
+
+        metas = hist.list_meta()
+
+        assert [m.id for m in metas] == [id2, id1]
+        assert metas[0].topic == "topic B"
+        assert not hasattr(metas[0], "summary")
+
+    def test_respects_limit(self, sample_summary):
+        for i in range(4):
+            hist.save(f"topic {i}", sample_summary)
+        assert len(hist.list_meta(limit=2)) == 2
+
+
 class TestDelete:
     def test_delete_existing(self, sample_summary):
         row_id = hist.save("ml", sample_summary)
@@ -86,3 +120,151 @@ class TestDelete:
         hist.delete(row_id)
         ids = [e.id for e in hist.get_all()]
         assert row_id not in ids
+
+
+class TestTimestamps:
+    def test_created_at_stored_as_integer(self, sample_summary):
+        hist.save("ml", sample_summary)
+        with hist._connect() as conn:
+            kind = conn.execute("SELECT typeof(created_at) FROM searches").fetchone()[0]
+        assert kind == "integer"
+
+    def test_created_at_round_trips_as_aware_utc(self, sample_summary):
+        row_id = hist.save("ml", sample_summary)
+        created = hist.get_by_id(row_id).created_at
+        assert created.tzinfo is not None
+        assert created.utcoffset().total_seconds() == 0
+
+    def test_migrates_iso_text_timestamps(self, sample_summary):
+        make_text_table(("old", "2024-05-01T12:30:00.123456+00:00", sample_summary))
+
+        hist.init_db()
+
+        entry = hist.get_all()[0]
+        assert entry.topic == "old"
+        assert entry.created_at == datetime(2024, 5, 1, 12, 30, 0, 123456, tzinfo=timezone.utc)
+
+    def test_naive_timestamp_treated_as_utc(self, sample_summary):
+        make_text_table(
+            ("aware", "2024-05-01T12:30:00+00:00", sample_summary),
+            ("naive", "2024-05-02T08:00:00", sample_summary),
+        )
+
+        hist.init_db()
+
+        entries = {e.topic: e.created_at for e in hist.get_all()}
+        assert entries["naive"] == datetime(2024, 5, 2, 8, 0, tzinfo=timezone.utc)
+
+    def test_unparseable_timestamp_leaves_table_intact(self, sample_summary):
+        make_text_table(
+            ("good", "2024-05-01T12:30:00+00:00", sample_summary),
+            ("bad", "yesterday", sample_summary),
+        )
+
+        with pytest.raises(ValueError):
+            hist.init_db()
+
+        assert text_table_topics() == ["good", "bad"]
+
+    def test_failed_rebuild_rolls_back(self, sample_summary, monkeypatch):
+        make_text_table(("old", "2024-05-01T12:30:00+00:00", sample_summary))
+        monkeypatch.setattr(hist, "_CREATE_TABLE", "CREATE TABLE searches (")
+
+        with pytest.raises(sqlite3.OperationalError):
+            with hist._connect() as conn:
+                hist._migrate_text_timestamps(conn)
+
+        assert text_table_topics() == ["old"]
+
+
+def make_text_table(*rows: tuple[str, str, TopicSummary]) -> None:
+    """Replace ``searches`` with a pre-epoch table holding ISO TEXT timestamps."""
+    with hist._connect() as conn:
+        conn.execute("DROP TABLE searches")
+        conn.execute(
+            "CREATE TABLE searches (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "topic TEXT NOT NULL, created_at TEXT NOT NULL, summary TEXT NOT NULL)"
+        )
+        conn.executemany(
+            "INSERT INTO searches (topic, created_at, summary) VALUES (?, ?, ?)",
+            [(topic, created_at, summary.model_dump_json()) for topic, created_at, summary in rows],
+        )
+
+
+def text_table_topics() -> list[str]:
+    """Return the topics of a still-unmigrated table, asserting it is untouched."""
+    with hist._connect() as conn:
+        tables = {r["name"] for r in conn.execute("SELECT name FROM sqlite_master")}
+        column_types = {r["name"]: r["type"] for r in conn.execute("PRAGMA table_info(searches)")}
+        topics = [r["topic"] for r in conn.execute("SELECT topic FROM searches ORDER BY id")]
+    assert "searches_old" not in tables
+    assert column_types["created_at"] == "TEXT"
+    return topics
+
+
+class TestDeduplication:
+    def test_identical_save_reuses_row(self, sample_summary):
+        first = hist.save("ml", sample_summary)
+        second = hist.save("ml", sample_summary)
+
+        assert second == first
+        assert len(hist.get_all()) == 1
+
+    def test_resave_moves_entry_to_newest(self, sample_summary, monkeypatch):
+        ticks = iter(range(1, 100))
+        monkeypatch.setattr(hist, "_now_us", lambda: next(ticks))
+        old = hist.save("ml", sample_summary)
+        hist.save("other", sample_summary)
+        hist.save("ml", sample_summary)
+
+        assert [m.id for m in hist.list_meta()][0] == old
+
+    def test_same_summary_under_new_topic_is_kept(self, sample_summary):
+        hist.save("ml", sample_summary)
+        hist.save("machine learning", sample_summary)
+
+        assert len(hist.get_all()) == 2
+
+    def test_save_many_deduplicates(self, sample_summary):
+        hist.save_many([("ml", sample_summary), ("ml", sample_summary)])
+
+        assert len(hist.get_all()) == 1
+
+    def test_legacy_table_gains_hash_column(self, sample_summary):
+        with hist._connect() as conn:
+            conn.execute("DROP TABLE searches")
+            conn.execute(
+                "CREATE TABLE searches (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "topic TEXT NOT NULL, created_at INTEGER NOT NULL, summary TEXT NOT NULL)"
+            )
+            conn.execute(
+                "INSERT INTO searches (topic, created_at, summary) VALUES (?, ?, ?)",
+                ("old", 0, sample_summary.model_dump_json()),
+            )
+
+        hist.init_db()
+        hist.save("ml", sample_summary)
+        hist.save("ml", sample_summary)
+
+        assert [m.topic for m in hist.list_meta()] == ["ml", "old"]
+
+
+class TestConnection:
+    def test_connection_reused_across_calls(self, sample_summary):
+        hist.save("ml", sample_summary)
+        first = hist._conn
+        hist.get_all()
+        assert hist._conn is first
+
+    def test_uses_wal_journal(self):
+        with hist._connect() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_reset_closes_and_reopens(self, sample_summary):
+        row_id = hist.save("ml", sample_summary)
+        first = hist._conn
+        hist._reset_connection()
+        assert hist._conn is None
+        assert hist.get_by_id(row_id) is not None
+        assert hist._conn is not first
@@ -9,8 +9,66 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from core.client import RateLimiter, get_client
 from core.models import SourceRef, TopicSummary
-from core.researcher import research, research_streaming, structure
+from core.researcher import (
+    _try_regex_structure,
+    research,
+    research_many,
+    research_streaming,
+    structure,
+    structure_streaming,
+)
+
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+def make_stream(*events: MagicMock) -> MagicMock:
+    """Return a fake ``messages.stream`` context manager emitting *events*."""
+    fake_stream = MagicMock()
+    fake_stream.__iter__ = MagicMock(return_value=iter(events))
+    fake_stream.__enter__ = MagicMock(return_value=fake_stream)
+    fake_stream.__exit__ = MagicMock(return_value=False)
+    return fake_stream
+
+
+def text_delta(chunk: str) -> MagicMock:
+    """Return a ``content_block_delta`` stream event carrying *chunk*."""
+    event = MagicMock(type="content_block_delta")
+    event.delta = MagicMock(type="text_delta", text=chunk)
+    return event
+
+
+def search_hit(url: str, title: str = "T", page_age: str | None = None) -> MagicMock:
+    """Return one ``web_search_result`` entry."""
+    return MagicMock(type="web_search_result", title=title, url=url, page_age=page_age)
+
+
+def search_block(*hits: MagicMock) -> MagicMock:
+    """Return a ``content_block_start`` event for a web search result block."""
+    event = MagicMock(type="content_block_start")
+    event.content_block = MagicMock(type="web_search_tool_result", content=list(hits))
+    return event
+
+
+def make_text_stream(*chunks: str) -> MagicMock:
+    """Return a fake ``messages.stream`` context manager emitting text deltas."""
+    return make_stream(*map(text_delta, chunks))
+
+
+def split_json(summary: TopicSummary) -> tuple[str, str]:
+    """Split *summary*'s JSON into two chunks, as a streamed response would arrive."""
+    text = summary.model_dump_json()
+    return text[:20], text[20:]
+
+
+@pytest.fixture(autouse=True)
+def fresh_client():
+    """Drop the cached Anthropic client so each test sees its own mock."""
+    get_client.cache_clear()
+    yield
+    get_client.cache_clear()
 
 
 @pytest.fixture
@@ -35,23 +93,10 @@ class TestResearchStreaming:
             list(research_streaming("   "))
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
-    @patch("core.researcher.anthropic.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_yields_tokens_and_raw_text(self, mock_cls):
-        # Build fake streaming events
-        text_event = MagicMock()
-        text_event.type = "content_block_delta"
-        delta = MagicMock()
-        delta.type = "text_delta"
-        delta.text = "Hello world"
-        text_event.delta = delta
-
-        fake_stream = MagicMock()
-        fake_stream.__iter__ = MagicMock(return_value=iter([text_event]))
-        fake_stream.__enter__ = MagicMock(return_value=fake_stream)
-        fake_stream.__exit__ = MagicMock(return_value=False)
-
         mock_client = MagicMock()
-        mock_client.beta.messages.stream.return_value = fake_stream
+        mock_client.beta.messages.stream.return_value = make_text_stream("Hello world")
         mock_cls.return_value = mock_client
 
         events = list(research_streaming("quantum computing"))
@@ -64,16 +109,145 @@ class TestResearchStreaming:
         assert len(raw_events) == 1
         assert raw_events[0][1] == "Hello world"
 
+    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+    @patch("anthropic.Anthropic")
+    def test_collect_raw_false_skips_raw_text(self, mock_cls):
+        mock_client = MagicMock()
+        mock_client.beta.messages.stream.return_value = make_text_stream("Hello")
+        mock_cls.return_value = mock_client
+
+        events = list(research_streaming("quantum computing", collect_raw=False))
+
+        assert events == [("token", "Hello")]
+
+    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+    @patch("anthropic.Anthropic")
+    def test_yields_sources_from_search_results(self, mock_cls):
+        hit = search_hit("https://nature.com", title="Nature", page_age="2 days ago")
+
+        mock_client = MagicMock()
+        mock_client.beta.messages.stream.return_value = make_stream(
+            MagicMock(type="message_start"), search_block(hit),
+        )
+        mock_cls.return_value = mock_client
+
+        events = list(research_streaming("quantum computing"))
+
+        assert events[0] == ("source", SourceRef(
+            title="Nature", url="https://nature.com", snippet="2 days ago",
+        ))
+        assert events[-1] == ("raw_text", "")
+
+    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+    @patch("anthropic.Anthropic")
+    def test_duplicate_sources_yielded_once(self, mock_cls):
+        mock_client = MagicMock()
+        mock_client.beta.messages.stream.return_value = make_stream(
+            search_block(search_hit("https://a.com"), search_hit("https://b.com")),
+            search_block(search_hit("https://a.com"), search_hit("https://c.com")),
+        )
+        mock_cls.return_value = mock_client
+
+        sources = [p.url for t, p in research_streaming("quantum computing") if t == "source"]
+
+        assert sources == ["https://a.com", "https://b.com", "https://c.com"]
+
+    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+    @patch("anthropic.Anthropic")
+    def test_small_deltas_are_batched(self, mock_cls):
+        mock_client = MagicMock()
+        mock_client.beta.messages.stream.return_value = make_text_stream(*"Hello")
+        mock_cls.return_value = mock_client
+
+        with patch("core.researcher.time.monotonic", return_value=0.0):
+            events = list(research_streaming("quantum computing"))
+
+        assert events == [("token", "Hello"), ("raw_text", "Hello")]
+
+    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+    @patch("anthropic.Anthropic")
+    def test_batch_flushes_at_size_limit(self, mock_cls):
+        mock_client = MagicMock()
+        mock_client.beta.messages.stream.return_value = make_text_stream("a" * 40, "b" * 40, "c")
+        mock_cls.return_value = mock_client
+
+        with patch("core.researcher.time.monotonic", return_value=0.0):
+            events = list(research_streaming("quantum computing", collect_raw=False))
+
+        assert events == [("token", "a" * 40 + "b" * 40), ("token", "c")]
+
+    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+    @patch("anthropic.Anthropic")
+    def test_pending_tokens_flushed_before_source(self, mock_cls):
+        mock_client = MagicMock()
+        mock_client.beta.messages.stream.return_value = make_stream(
+            text_delta("Hi"), search_block(search_hit("https://nature.com")),
+        )
+        mock_cls.return_value = mock_client
+
+        events = list(research_streaming("quantum computing", collect_raw=False))
+
+        assert [t for t, _ in events] == ["token", "source"]
+
+    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+    @patch("anthropic.Anthropic")
+    def test_deadline_checked_on_slow_non_text_event(self, mock_cls):
+        clock = [0.0]
+
+        def sdk_events():
+            yield text_delta("Let me search.")
+            clock[0] = 2.0  # Server-side search latency before the next event
+            yield MagicMock(type="content_block_start",
+                            content_block=MagicMock(type="server_tool_use"))
+            yield text_delta("Found it.")
+
+        stream = make_stream()
+        stream.__iter__ = MagicMock(return_value=sdk_events())
+        mock_client = MagicMock()
+        mock_client.beta.messages.stream.return_value = stream
+        mock_cls.return_value = mock_client
+
+        with patch("core.researcher.time.monotonic", side_effect=lambda: clock[0]):
+            events = list(research_streaming("quantum computing", collect_raw=False))
+
+        assert events == [("token", "Let me search."), ("token", "Found it.")]
+
+    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+    @patch("anthropic.Anthropic")
+    def test_block_stop_flushes_pending_tokens(self, mock_cls):
+        mock_client = MagicMock()
+        mock_client.beta.messages.stream.return_value = make_stream(
+            text_delta("Let me search."), MagicMock(type="content_block_stop"), text_delta("More"),
+        )
+        mock_cls.return_value = mock_client
+
+        with patch("core.researcher.time.monotonic", return_value=0.0):
+            events = list(research_streaming("quantum computing", collect_raw=False))
+
+        assert events == [("token", "Let me search."), ("token", "More")]
+
+    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+    @patch("anthropic.Anthropic")
+    def test_slow_consumer_does_not_hold_limiter_slot(self, mock_cls):
+        mock_client = MagicMock()
+        mock_client.beta.messages.stream.return_value = make_text_stream("a", "b")
+        mock_cls.return_value = mock_client
+        limiter = RateLimiter(max_concurrent=1, timeout=0.01)
+
+        with patch("core.client.get_limiter", return_value=limiter):
+            stream = research_streaming("quantum computing", collect_raw=False)
+            next(stream)  # Consumer pauses mid-stream
+            with limiter.slot():
+                pass
+            stream.close()
+
 
 class TestStructure:
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
-    @patch("core.researcher.anthropic.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_returns_topic_summary(self, mock_cls, sample_summary):
-        fake_response = MagicMock()
-        fake_response.parsed_output = sample_summary
-
         mock_client = MagicMock()
-        mock_client.messages.parse.return_value = fake_response
+        mock_client.messages.stream.return_value = make_text_stream(*split_json(sample_summary))
         mock_cls.return_value = mock_client
 
         result = structure(
@@ -86,15 +260,13 @@ class TestStructure:
         assert result.topic == "quantum computing"
 
     @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
-    @patch("core.researcher.anthropic.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_merges_sources_when_empty(self, mock_cls, sample_summary):
         """If Claude returns no sources, streaming-captured sources are used."""
         no_sources = sample_summary.model_copy(update={"sources": []})
-        fake_response = MagicMock()
-        fake_response.parsed_output = no_sources
 
         mock_client = MagicMock()
-        mock_client.messages.parse.return_value = fake_response
+        mock_client.messages.stream.return_value = make_text_stream(no_sources.model_dump_json())
         mock_cls.return_value = mock_client
 
         extra_source = SourceRef(title="Nature", url="https://nature.com")
@@ -105,3 +277,159 @@ class TestStructure:
         )
 
         assert result.sources == [extra_source]
+
+    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+    @patch("anthropic.Anthropic")
+    def test_invalid_json_raises_runtime_error(self, mock_cls):
+        mock_client = MagicMock()
+        mock_client.messages.stream.return_value = make_text_stream('{"topic": "x"}')
+        mock_cls.return_value = mock_client
+
+        with pytest.raises(RuntimeError):
+            structure(topic="x", raw_text="text", sources=[])
+
+    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+    @patch("anthropic.Anthropic")
+    def test_malformed_json_raises_runtime_error(self, mock_cls):
+        mock_client = MagicMock()
+        mock_client.messages.stream.return_value = make_text_stream('{"topic": ')
+        mock_cls.return_value = mock_client
+
+        with pytest.raises(RuntimeError):
+            structure(topic="x", raw_text="text", sources=[])
+
+
+SECTIONED_REPORT = """\
+## Overview
+Quantum computing uses qubits.
+
+## 5 Key Points
+1. Superposition
+2. Entanglement
+3. **Error correction** is improving
+
+## Current Trends
+Increasing investment in 2025.
+
+## Known Gaps
+Limited real-world applications so far.
+"""
+
+
+class TestRegexFastPath:
+    @patch("anthropic.Anthropic")
+    def test_sectioned_report_skips_claude(self, mock_cls):
+        source = SourceRef(title="Nature", url="https://nature.com")
+
+        events = list(structure_streaming("quantum computing", SECTIONED_REPORT, [source],
+                                          lens="scientific"))
+
+        mock_cls.assert_not_called()
+        assert len(events) == 1
+        event_type, summary = events[0]
+        assert event_type == "structured"
+        assert summary.overview == "Quantum computing uses qubits."
+        assert summary.key_points == ["Superposition", "Entanglement",
+                                      "Error correction is improving"]
+        assert summary.trends == "Increasing investment in 2025."
+        assert summary.gaps_and_caveats == "Limited real-world applications so far."
+        assert summary.sources == [source]
+        assert summary.lens == "scientific"
+
+    def test_bold_headings_and_lens_section_names(self):
+        report = (
+            "**Market Overview**\nTAM is $10B.\n\n"
+            "**Investment Highlights:**\n- A\n- B\n- C\n\n"
+            "**Market Trends**\nConsolidation.\n\n"
+            "**Due-Diligence Risks**\nRegulation.\n"
+        )
+
+        summary = _try_regex_structure("x", report, [], lens="vc")
+
+        assert summary is not None
+        assert summary.key_points == ["A", "B", "C"]
+        assert summary.gaps_and_caveats == "Regulation."
+
+    def test_inline_markdown_stripped_to_plain_text(self):
+        report = SECTIONED_REPORT.replace(
+            "Quantum computing uses qubits.",
+            "Quantum computing uses *qubits*, see [IBM](https://ibm.com/quantum).",
+        ).replace("1. Superposition", "1. `Superposition` of __states__")
+
+        summary = _try_regex_structure("x", report, [])
+
+        assert summary.overview == "Quantum computing uses qubits, see IBM."
+        assert summary.key_points[0] == "Superposition of states"
+
+    def test_document_title_is_not_a_section(self):
+        report = (
+            "# Quantum Computing: Current State and Trends\n"
+            "An introduction that is not about trends.\n\n"
+            + SECTIONED_REPORT
+        )
+
+        summary = _try_regex_structure("x", report, [])
+
+        assert summary is not None
+        assert summary.trends == "Increasing investment in 2025."
+
+    def test_bold_line_inside_section_is_body_text(self):
+        report = SECTIONED_REPORT.replace(
+            "1. Superposition", "**Superposition**\n1. Superposition",
+        )
+
+        summary = _try_regex_structure("x", report, [])
+
+        assert summary.key_points == ["Superposition", "Entanglement",
+                                      "Error correction is improving"]
+
+    def test_duplicate_section_falls_back(self):
+        report = SECTIONED_REPORT + "\n## Emerging Trends\nMore trends.\n"
+        assert _try_regex_structure("x", report, []) is None
+
+    def test_missing_section_falls_back(self):
+        report = SECTIONED_REPORT.split("## Known Gaps")[0]
+        assert _try_regex_structure("x", report, []) is None
+
+    def test_too_few_key_points_falls_back(self):
+        report = SECTIONED_REPORT.replace("2. Entanglement\n", "").replace(
+            "3. **Error correction** is improving\n", "")
+        assert _try_regex_structure("x", report, []) is None
+
+
+class TestStructureStreaming:
+    @patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+    @patch("anthropic.Anthropic")
+    def test_yields_deltas_then_summary(self, mock_cls, sample_summary):
+        first, rest = split_json(sample_summary)
+        mock_client = MagicMock()
+        mock_client.messages.stream.return_value = make_text_stream(first, rest)
+        mock_cls.return_value = mock_client
+
+        events = list(structure_streaming("quantum computing", "text", [], lens="vc"))
+
+        assert events[:2] == [("structure_delta", first), ("structure_delta", rest)]
+        assert events[-1][0] == "structured"
+        assert events[-1][1].lens == "vc"
+
+
+class TestResearchMany:
+    def test_empty_topics(self):
+        assert research_many([]) == []
+
+    @patch("core.researcher.research")
+    def test_preserves_topic_order(self, mock_research, sample_summary):
+        mock_research.side_effect = lambda topic, lens: sample_summary.model_copy(
+            update={"topic": topic, "lens": lens}
+        )
+
+        results = research_many(["a", "b", "c"], lens="vc", max_workers=2)
+
+        assert [r.topic for r in results] == ["a", "b", "c"]
+        assert all(r.lens == "vc" for r in results)
+
+    @patch("core.researcher.research")
+    def test_propagates_errors(self, mock_research):
+        mock_research.side_effect = ValueError("Topic must not be empty.")
+        with pytest.raises(ValueError):
+            research_many(["  "])
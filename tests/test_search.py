@@ -1,10 +1,14 @@
-"""Tests for core/search.py — intent detection and time-range parsing."""
+"""Tests for core/search.py — intent detection, time-range parsing, orchestration."""
 
 from __future__ import annotations
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 
-from core.search import Intent, detect_intent, parse_time_range
+import core.search as search
+from core.client import RateLimiter
+from core.search import Intent, SearchOrchestrator, detect_intent, parse_time_range
 
 
 # ── Intent detection ───────────────────────────────────────────────────────────
@@ -17,6 +21,10 @@ class TestDetectIntent:
     def test_academic_study_keyword(self):
         assert detect_intent("latest study on transformer attention") == Intent.ACADEMIC
 
+    def test_tie_prefers_earlier_intent(self):
+        # One academic ("paper") and one business ("startup") signal
+        assert detect_intent("paper about a startup") == Intent.ACADEMIC
+
     def test_tutorial_how_to(self):
         assert detect_intent("how to use React hooks tutorial") == Intent.TUTORIAL
 
@@ -62,3 +70,222 @@ class TestParseTimeRange:
     def test_case_insensitive(self):
         result = parse_time_range("Past 3 Months AI trends")
         assert result is not None
+
+    def test_last_n_weeks(self):
+        assert parse_time_range("LLM releases last 2 weeks") == "last 2 weeks"
+
+    def test_earliest_hint_wins(self):
+        assert parse_time_range("2023 vs past 6 months") == "2023"
+
+
+# ── Signal counting backends ───────────────────────────────────────────────────
+
+
+SIGNAL_QUERIES = [
+    "arxiv papers on LLM reasoning",
+    "how to learn python step by step guide",
+    "saas startup series a funding market",
+    "research study on startup funding tutorial",
+    "",
+]
+
+
+class TestCountSignals:
+    @pytest.mark.parametrize("query", SIGNAL_QUERIES)
+    def test_automaton_matches_substring_fallback(self, query, monkeypatch):
+        if search._signal_automaton() is None:
+            pytest.skip("pyahocorasick not installed")
+        with_automaton = search._count_signals(query)
+        monkeypatch.setattr(search, "_signal_automaton", lambda: None)
+        assert search._count_signals(query) == with_automaton
+
+    def test_overlapping_signals_each_count(self):
+        assert search._count_signals("papers")[Intent.ACADEMIC] == 2  # paper + papers
+
+
+# ── Result serialisation ───────────────────────────────────────────────────────
+
+
+class TestSearchResultToApiDict:
+    def test_ai_summary_falls_back_to_snippet(self):
+        result = search.SearchResult(title="T", url="https://a.com", snippet="S", source="a.com")
+        assert result.to_api_dict() == {
+            "title": "T",
+            "url": "https://a.com",
+            "snippet": "S",
+            "ai_summary": "S",
+            "source": "a.com",
+            "published_date": None,
+            "relevance_explanation": "",
+        }
+
+    def test_ai_summary_preferred_when_set(self):
+        result = search.SearchResult(title="T", url="u", snippet="S", source="", ai_summary="AI")
+        assert result.to_api_dict()["ai_summary"] == "AI"
+
+
+# ── Search orchestration ───────────────────────────────────────────────────────
+
+
+def make_settings(**overrides):
+    settings = MagicMock()
+    settings.anthropic_api_key = "test-key"
+    settings.research_model = "claude-haiku-4-5"
+    settings.max_web_searches = 3
+    settings.max_search_results = 10
+    settings.search_cache_size = 16
+    settings.search_cache_ttl = 60
+    for k, v in overrides.items():
+        setattr(settings, k, v)
+    return settings
+
+
+def make_stream(events: list) -> MagicMock:
+    fake_stream = MagicMock()
+    fake_stream.__iter__ = MagicMock(return_value=iter(events))
+    fake_stream.__enter__ = MagicMock(return_value=fake_stream)
+    fake_stream.__exit__ = MagicMock(return_value=False)
+    return fake_stream
+
+
+def search_hit(url: str, title: str = "Title") -> MagicMock:
+    return MagicMock(type="web_search_result", url=url, title=title, page_age=None)
+
+
+def block_event(*hits: MagicMock) -> MagicMock:
+    event = MagicMock(type="content_block_start")
+    event.content_block = MagicMock(type="web_search_tool_result", content=list(hits))
+    return event
+
+
+def text_event(text: str) -> MagicMock:
+    event = MagicMock(type="content_block_delta")
+    event.delta = MagicMock(type="text_delta", text=text)
+    return event
+
+
+class TestSearchOrchestrator:
+    def test_blank_query_raises(self):
+        with pytest.raises(ValueError, match="empty"):
+            SearchOrchestrator(make_settings()).search("   ")
+
+    def test_collects_results_and_text(self):
+        orchestrator = SearchOrchestrator(make_settings())
+        orchestrator._client = MagicMock()
+        orchestrator._client.beta.messages.stream.return_value = make_stream([
+            MagicMock(type="message_start"),
+            block_event(search_hit("https://www.arxiv.org/abs/1", "Paper")),
+            text_event("Hello "),
+            text_event("world"),
+        ])
+
+        response = orchestrator.search("arxiv papers on LLM reasoning")
+
+        assert response.intent == Intent.ACADEMIC
+        assert response.raw_text == "Hello world"
+        assert [r.url for r in response.results] == ["https://www.arxiv.org/abs/1"]
+        assert response.results[0].source == "arxiv.org"
+
+    def test_results_capped_at_max_search_results(self):
+        orchestrator = SearchOrchestrator(make_settings(max_search_results=2))
+        orchestrator._client = MagicMock()
+        orchestrator._client.beta.messages.stream.return_value = make_stream([
+            block_event(*(search_hit(f"https://site{i}.com") for i in range(4))),
+        ])
+
+        assert len(orchestrator.search("quantum computing").results) == 2
+
+    def test_duplicate_urls_collected_once(self):
+        orchestrator = SearchOrchestrator(make_settings(max_search_results=2))
+        orchestrator._client = MagicMock()
+        orchestrator._client.beta.messages.stream.return_value = make_stream([
+            block_event(search_hit("https://a.com"), search_hit("https://b.com")),
+            block_event(search_hit("https://a.com"), search_hit("https://c.com")),
+        ])
+
+        results = orchestrator.search("quantum computing").results
+
+        assert [r.url for r in results] == ["https://a.com", "https://b.com"]
+
+    def test_repeat_query_served_from_cache(self):
+        orchestrator = SearchOrchestrator(make_settings())
+        orchestrator._client = MagicMock()
+        orchestrator._client.beta.messages.stream.return_value = make_stream([
+            block_event(search_hit("https://site.com")),
+        ])
+
+        first = orchestrator.search("quantum computing")
+        second = orchestrator.search("  Quantum Computing ")
+
+        orchestrator._client.beta.messages.stream.assert_called_once()
+        assert not first.cached
+        assert second.cached
+        assert second.query == "Quantum Computing"
+        assert second.results == first.results
+
+    def test_cache_hits_do_not_share_results(self):
+        orchestrator = SearchOrchestrator(make_settings())
+        orchestrator._client = MagicMock()
+        orchestrator._client.beta.messages.stream.return_value = make_stream([
+            block_event(search_hit("https://site.com")),
+        ])
+
+        orchestrator.search("quantum computing").results[0].content_type = "videos"
+        second = orchestrator.search("quantum computing")
+        second.results[0].content_type = "code"
+        third = orchestrator.search("quantum computing")
+
+        assert third.results[0].content_type == "news"
+        assert third.results is not second.results
+
+    def test_empty_results_not_cached(self):
+        orchestrator = SearchOrchestrator(make_settings())
+        orchestrator._client = MagicMock()
+        orchestrator._client.beta.messages.stream.side_effect = lambda **_: make_stream([])
+
+        orchestrator.search("quantum computing")
+        orchestrator.search("quantum computing")
+
+        assert orchestrator._client.beta.messages.stream.call_count == 2
+
+    def test_cache_disabled_when_size_zero(self):
+        orchestrator = SearchOrchestrator(make_settings(search_cache_size=0))
+        orchestrator._client = MagicMock()
+        orchestrator._client.beta.messages.stream.side_effect = lambda **_: make_stream([])
+
+        orchestrator.search("quantum computing")
+        orchestrator.search("quantum computing")
+
+        assert orchestrator._client.beta.messages.stream.call_count == 2
+
+
+    def test_slot_released_once_stream_opens(self):
+        limiter = RateLimiter(max_concurrent=1, timeout=0.01)
+        acquired = []
+
+        def events():
+            with limiter.slot():  # Would time out if search() still held it
+                acquired.append(True)
+            yield block_event(search_hit("https://site.com"))
+
+        stream = make_stream([])
+        stream.__iter__ = MagicMock(return_value=events())
+        orchestrator = SearchOrchestrator(make_settings())
+        orchestrator._client = MagicMock()
+        orchestrator._client.beta.messages.stream.return_value = stream
+
+        with patch("core.client.get_limiter", return_value=limiter):
+            orchestrator.search("quantum computing")
+
+        assert acquired == [True]
+
+
+class TestHostname:
+    def test_strips_www(self):
+        assert search._hostname("https://www.arxiv.org/abs/1") == "arxiv.org"
+
+    def test_falls_back_to_url_without_netloc(self):
+        assert search._hostname("not a url") == "not a url"
+
+    def test_malformed_ipv6_returns_url(self):
+        assert search._hostname("http://[::1") == "http://[::1"
@@ -0,0 +1,37 @@
+"""Tests for config/settings.py — environment parsing and validation."""
+
+from __future__ import annotations
+
+import pytest
+
+from config.settings import Settings
+
+
+def test_defaults(monkeypatch):
+    for name in ("ANTHROPIC_MAX_CONCURRENCY", "ANTHROPIC_REQUESTS_PER_MINUTE",
+                 "ANTHROPIC_SLOT_TIMEOUT"):
+        monkeypatch.delenv(name, raising=False)
+
+    settings = Settings()
+
+    assert settings.anthropic_max_concurrency == 8
+    assert settings.anthropic_requests_per_minute == 0
+    assert settings.anthropic_slot_timeout == 30
+
+
+def test_rate_accepts_fractions(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_REQUESTS_PER_MINUTE", "0.5")
+    assert Settings().anthropic_requests_per_minute == 0.5
+
+
+@pytest.mark.parametrize("name, value, message", [
+    ("ANTHROPIC_MAX_CONCURRENCY", "0", "must be at least 1"),
+    ("ANTHROPIC_MAX_CONCURRENCY", "eight", "must be a number"),
+    ("ANTHROPIC_REQUESTS_PER_MINUTE", "-5", "must not be negative"),
+    ("ANTHROPIC_SLOT_TIMEOUT", "0", "must be greater than 0"),
+    ("PORT", "http", "must be a number"),
+])
+def test_invalid_values_raise(monkeypatch, name, value, message):
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValueError, match=f"{name} {message}"):
+        Settings()
@@ -17,6 +17,8 @@ def make_settings(**overrides):
     settings = MagicMock()
     settings.anthropic_api_key = "test-key"
     settings.summary_model = "claude-haiku-4-5"
+    settings.search_cache_size = 16
+    settings.search_cache_ttl = 60
     for k, v in overrides.items():
         setattr(settings, k, v)
     return settings
@@ -87,3 +89,53 @@ class TestGenerateExecutiveSummary:
         assert isinstance(summary, ExecutiveSummary)
         assert isinstance(summary.overview, str)
         assert len(summary.overview) > 0
+
+    def test_raw_text_used_as_overview(self):
+        s = Summarizer(make_settings())
+        summary = s.generate_executive_summary(
+            "quantum", make_results(2), Intent.ACADEMIC, raw_text="  Report.  ",
+        )
+        assert summary.overview == "Report."
+
+    def test_repeat_prompt_served_from_cache(self):
+        s = Summarizer(make_settings())
+        s._client = MagicMock()
+        s._client.messages.create.return_value.content = [MagicMock(
+            text='{"overview": "O", "key_themes": ["T"], "notable_trends": [], "top_entities": []}',
+        )]
+        results = make_results(3)
+
+        first = s.generate_executive_summary("quantum", results, Intent.ACADEMIC)
+        second = s.generate_executive_summary("quantum", results, Intent.ACADEMIC)
+
+        s._client.messages.create.assert_called_once()
+        assert second == first
+        assert first.key_themes == ["T"]
+
+    def test_cache_hits_do_not_share_summaries(self):
+        s = Summarizer(make_settings())
+        s._client = MagicMock()
+        s._client.messages.create.return_value.content = [MagicMock(
+            text='{"overview": "O", "key_themes": ["T"], "notable_trends": [], "top_entities": []}',
+        )]
+        results = make_results(3)
+
+        s.generate_executive_summary("quantum", results, Intent.ACADEMIC).key_themes.append("X")
+        second = s.generate_executive_summary("quantum", results, Intent.ACADEMIC)
+        second.key_themes.append("Y")
+        second.overview = "edited"
+        third = s.generate_executive_summary("quantum", results, Intent.ACADEMIC)
+
+        assert third.key_themes == ["T"]
+        assert third.overview == "O"
+
+    def test_failed_summary_not_cached(self):
+        s = Summarizer(make_settings())
+        s._client = MagicMock()
+        s._client.messages.create.side_effect = RuntimeError("boom")
+        results = make_results(3)
+
+        s.generate_executive_summary("quantum", results, Intent.ACADEMIC)
+        s.generate_executive_summary("quantum", results, Intent.ACADEMIC)
+
+        assert s._client.messages.create.call_count == 2
@@ -13,6 +13,7 @@ import json
 import logging
 import os
 import sys
+from functools import lru_cache
 
 # Allow running as `python web/app.py` from the project root
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -22,31 +23,100 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from flask import Flask, jsonify, render_template, request
+from flask.json.provider import DefaultJSONProvider
 
-from config.settings import Settings
+try:
+    import orjson  # Optional: faster JSON encoding for API responses
+except ImportError:
+    orjson = None
+
+from config.settings import get_settings
 from core.aggregator import aggregate
-from core.categorizer import classify_result
+from core.categorizer import CONTENT_TYPE_LABELS, classify_result
 from core.search import SearchOrchestrator, detect_intent, parse_time_range
 from core.summarizer import Summarizer
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
 logger = logging.getLogger(__name__)
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Honours ``sort_keys`` and indentation like ``DefaultJSONProvider``;
+    output is always UTF-8, so ``ensure_ascii`` has no effect.
+    """
+
+    def dumps(self, obj: object, **kwargs: object) -> str:
+        """Serialise *obj* to a JSON string with orjson.
+
+        Args:
+            obj: The data to serialise.
+            **kwargs: ``default`` and ``sort_keys`` override the provider's
+                settings. Any truthy ``indent`` gives two-space indentation,
+                the only width orjson supports. Other options such as
+                ``ensure_ascii`` or ``separators`` are ignored.
+
+        Returns:
+            The JSON document.
+        """
+        option = 0
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        default = kwargs.get("default", self.default)
+        return orjson.dumps(obj, default=default, option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: object) -> object:
+        """Parse a JSON document with orjson.
+
+        Args:
+            s: The JSON text.
+            **kwargs: Accepted for API compatibility and ignored; orjson
+                takes no parsing options.
+
+        Returns:
+            The decoded Python object.
+        """
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
-settings = Settings()
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+settings = get_settings()
 
 # Initialise core services
 _orchestrator = SearchOrchestrator(settings)
 _summarizer = Summarizer(settings)
 
+#: Section label keyed by the plain content-type string used in sections.
+_LABEL_BY_TYPE: dict[str, str] = {ct.value: label for ct, label in CONTENT_TYPE_LABELS.items()}
+
 
 # ── UI routes ──────────────────────────────────────────────────────────────────
 
+# The page shells are deterministic for a given query, so their rendered HTML
+# is cached. In debug mode templates are rendered fresh so edits show up.
+
+
+@lru_cache(maxsize=1)
+def _index_html() -> str:
+    return render_template("index.html")
+
+
+@lru_cache(maxsize=512)
+def _results_html(query: str) -> str:
+    return render_template("results.html", query=query)
+
 
 @app.route("/")
 def index() -> str:
     """Render the homepage with the search form."""
-    return render_template("index.html")
+    if app.debug:
+        return render_template("index.html")
+    return _index_html()
 
 
 @app.route("/results")
@@ -58,7 +128,9 @@ def results() -> str:
     value and skeleton layout for a fast perceived load time.
     """
     query = request.args.get("q", "").strip()
-    return render_template("results.html", query=query)
+    if app.debug:
+        return render_template("results.html", query=query)
+    return _results_html(query)
 
 
 # ── Search API ─────────────────────────────────────────────────────────────────
@@ -81,6 +153,7 @@ def search_api():
             "query": "...",
             "intent": "academic" | "tutorial" | "business" | "exploratory",
             "time_range": "...",           // null if not detected
+            "cached": false,               // true if served from the search cache
             "summary": {
                 "overview": "...",
                 "key_themes": ["...", ...],
@@ -142,25 +215,11 @@ def search_api():
         )
 
         # 5. Serialise
-        from core.categorizer import CONTENT_TYPE_LABELS, ContentType
         sections_json = [
             {
                 "type": section_type,
-                "label": CONTENT_TYPE_LABELS.get(
-                    ContentType(section_type), section_type
-                ),
-                "results": [
-                    {
-                        "title": r.title,
-                        "url": r.url,
-                        "snippet": r.snippet,
-                        "ai_summary": r.ai_summary or r.snippet,
-                        "source": r.source,
-                        "published_date": r.published_date,
-                        "relevance_explanation": r.relevance_explanation,
-                    }
-                    for r in section_results
-                ],
+                "label": _LABEL_BY_TYPE.get(section_type, section_type),
+                "results": [r.to_api_dict() for r in section_results],
             }
             for section_type, section_results in sections
         ]
@@ -169,6 +228,7 @@ def search_api():
             "query": query,
             "intent": response.intent.value,
             "time_range": response.time_range,
+            "cached": response.cached,
             "summary": {
                 "overview": summary.overview,
                 "key_themes": summary.key_themes,
@@ -180,6 +240,10 @@ def search_api():
 
     except ValueError as exc:
         return jsonify({"error": str(exc)}), 400
+    except TimeoutError:
+        # Every Claude API slot stayed busy past ANTHROPIC_SLOT_TIMEOUT
+        logger.warning("Search rejected under load for query=%r", query)
+        return jsonify({"error": "Search is busy right now; please retry shortly."}), 503
     except Exception as exc:
         logger.exception("Search error for query=%r", query)
         return jsonify({"error": f"Search failed: {type(exc).__name__}"}), 500